@@ -0,0 +1,100 @@
+# Benchmark for memory and time per tracking code of cargos.sketches.TrackingCodeIndex
+#
+# Run from the repository root:
+#     python -m benchmarks.tracking_code_index --codes 1000000
+
+import argparse
+import time
+import tracemalloc
+
+from cargos.sketches import BloomFilter, ScalableBloomFilter, TrackingCodeIndex
+
+
+def _measure(build, codes):
+    """
+    Returns the memory in bytes retained by the structure and the seconds spent building it
+
+    :param callable build: receives the codes and returns the built structure
+    :param List[str] codes: tracking codes to add
+    """
+    tracemalloc.start()
+    structure = build(codes)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    build(codes)
+    elapsed = time.perf_counter() - start
+    del structure
+    return memory, elapsed
+
+
+def _build_set(codes):
+    tracking_codes = set()
+    for code in codes:
+        tracking_codes.add(code)
+    return tracking_codes
+
+
+def _build_bloom_filter(codes):
+    bloom_filter = BloomFilter(capacity=len(codes))
+    for code in codes:
+        bloom_filter.add(code)
+    return bloom_filter
+
+
+def _build_scalable_bloom_filter(codes):
+    bloom_filter = ScalableBloomFilter(capacity=1024)
+    for code in codes:
+        bloom_filter.add(code)
+    return bloom_filter
+
+
+def _build_index(codes):
+    index = TrackingCodeIndex()
+    for code in codes:
+        index.add(code)
+    return index
+
+
+def _build_sized_index(codes):
+    index = TrackingCodeIndex(capacity=len(codes))
+    for code in codes:
+        index.add(code)
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Memory and time per tracking code of TrackingCodeIndex"
+    )
+    parser.add_argument("--codes", type=int, default=1000000)
+    arguments = parser.parse_args(argv)
+
+    # tracking codes are owned by the packages, so they are built before measuring
+    codes = [f"{code:010d}" for code in range(arguments.codes)]
+    print(f"{'Structure':<40}{'Memory (MB)':>12}{'Bytes/code':>12}{'us/add':>10}")
+    for name, build in (
+        ("set (exact store)", _build_set),
+        ("BloomFilter (1% error)", _build_bloom_filter),
+        ("ScalableBloomFilter (1% error)", _build_scalable_bloom_filter),
+        ("TrackingCodeIndex (filter + set)", _build_index),
+        ("TrackingCodeIndex sized (filter + set)", _build_sized_index),
+    ):
+        memory, elapsed = _measure(build, codes)
+        print(
+            f"{name:<40}{memory / 1e6:>12.1f}{memory / len(codes):>12.1f}"
+            f"{elapsed / len(codes) * 1e6:>10.2f}"
+        )
+
+    index = _build_index(codes)
+    for code in codes[: len(codes) // 100]:
+        index.add(code)
+    print(
+        f"\nAdding {len(codes)} new codes and {len(codes) // 100} duplicates checked the exact store "
+        f"{index.get_exact_lookups_count()} times"
+    )
+
+
+if __name__ == "__main__":
+    main()
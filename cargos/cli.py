@@ -0,0 +1,258 @@
+# This file contains the command line runner for cargo reports, heavy modules are imported lazily to keep startup fast
+
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+
+OUTPUT_FORMATS = ("text", "csv", "jsonl")
+INPUT_SOURCES = ("generator", "file")
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Returns the parser for command line arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m cargos",
+        description="Print the company report of total packages and invoice for each date in a range.",
+    )
+    parser.add_argument(
+        "start_date", type=date.fromisoformat, help="first date, ISO format"
+    )
+    parser.add_argument(
+        "end_date",
+        type=date.fromisoformat,
+        nargs="?",
+        help="last date, ISO format (default: start_date)",
+    )
+    parser.add_argument(
+        "--source",
+        choices=INPUT_SOURCES,
+        default="generator",
+        help="where cargos shipping are loaded from (default: generator)",
+    )
+    parser.add_argument(
+        "--input",
+        help="JSON lines file with a cargo shipping per line sorted by shipping date, for file source",
+    )
+    parser.add_argument(
+        "--total-items",
+        type=int,
+        default=5,
+        help="cargos shipping generated for each date, for generator source (default: 5)",
+    )
+    parser.add_argument(
+        "--random-charges",
+        action="store_true",
+        help="use random cargo charges, for generator source",
+    )
+    parser.add_argument(
+        "--unique-tracking-codes",
+        action="store_true",
+        help="count and invoice each tracking code only once for each date and write the duplicated packages",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="processes used to build the reports, for generator source (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="output format (default: text)",
+    )
+    parser.add_argument("--output", help="output file path (default: stdout)")
+    return parser
+
+
+def _iter_dates(start_date, end_date):
+    """Generate every date between start_date and end_date, both included"""
+    for day in range((end_date - start_date).days + 1):
+        yield start_date + timedelta(days=day)
+
+
+def _build_generator_report(
+    shipping_date, total_items, use_random_charges, unique_tracking_codes
+):
+    """
+    Returns (total packages, total invoice, duplicated packages) for a date using the shipping generator, defined at
+    module level so worker processes can run it
+
+    :param datetime.date shipping_date: requested shipping date
+    :param int total_items: cargos shipping generated for the date
+    :param bool use_random_charges: allow to define if random charges will be used
+    :param bool unique_tracking_codes: allow to count and invoice each tracking code only once
+    """
+    from cargos.services import get_cargo_invoices_report_for_date
+    from cargos.sketches import TrackingCodeIndex
+
+    tracking_index = None
+    if unique_tracking_codes:
+        tracking_index = TrackingCodeIndex(capacity=max(total_items, 1))
+    total_packages, total_invoice = get_cargo_invoices_report_for_date(
+        shipping_date,
+        total_items=total_items,
+        use_random_charges=use_random_charges,
+        tracking_index=tracking_index,
+    )
+    duplicates = tracking_index.get_duplicates_count() if tracking_index else 0
+    return total_packages, total_invoice, duplicates
+
+
+def _iter_generator_reports(arguments):
+    """
+    Generate (date, total packages, total invoice, duplicated packages) for each date using the shipping generator,
+    building the reports in worker processes when requested
+
+    :param argparse.Namespace arguments: parsed command line arguments
+    """
+    from functools import partial
+
+    build_report = partial(
+        _build_generator_report,
+        total_items=arguments.total_items,
+        use_random_charges=arguments.random_charges,
+        unique_tracking_codes=arguments.unique_tracking_codes,
+    )
+    dates = _iter_dates(arguments.start_date, arguments.end_date)
+
+    if arguments.workers <= 1:
+        for shipping_date in dates:
+            yield (shipping_date, *build_report(shipping_date))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    dates = list(dates)
+    chunk_size = max(1, len(dates) // (arguments.workers * 4))
+    with ProcessPoolExecutor(max_workers=arguments.workers) as executor:
+        reports = executor.map(build_report, dates, chunksize=chunk_size)
+        for shipping_date, report in zip(dates, reports):
+            yield (shipping_date, *report)
+
+
+def _iter_file_reports(arguments):
+    """
+    Generate (date, total packages, total invoice, duplicated packages) for each date with a single pass over the
+    input file, sorted by shipping date, each date is yielded as soon as its shipping are read
+
+    :param argparse.Namespace arguments: parsed command line arguments
+    """
+    from decimal import Decimal
+
+    from cargos.services import iter_cargo_invoices_reports_from_file
+
+    reports = iter_cargo_invoices_reports_from_file(
+        arguments.input,
+        arguments.start_date,
+        arguments.end_date,
+        arguments.unique_tracking_codes,
+    )
+    next_report = next(reports, None)
+    for shipping_date in _iter_dates(arguments.start_date, arguments.end_date):
+        if next_report is not None and next_report[0] == shipping_date:
+            yield next_report
+            next_report = next(reports, None)
+        else:
+            yield shipping_date, 0, Decimal("0"), 0
+
+
+def _write_reports(reports, output, output_format, include_duplicates=False):
+    """
+    Write each report as soon as it's available, invoices are always written with two decimals
+
+    :param Iterable[tuple] reports: (date, total packages, total invoice, duplicated packages) for each date
+    :param TextIO output: stream for write the reports
+    :param str output_format: one of OUTPUT_FORMATS
+    :param bool include_duplicates: allow to write the duplicated packages of each date
+    """
+    if output_format == "csv":
+        import csv
+
+        writer = csv.writer(output)
+        header = ["shipping_date", "total_packages", "total_invoice"]
+        if include_duplicates:
+            header.append("duplicated_packages")
+        writer.writerow(header)
+        for shipping_date, total_packages, total_invoice, duplicates in reports:
+            row = [shipping_date.isoformat(), total_packages, f"{total_invoice:.2f}"]
+            if include_duplicates:
+                row.append(duplicates)
+            writer.writerow(row)
+    elif output_format == "jsonl":
+        import json
+
+        for shipping_date, total_packages, total_invoice, duplicates in reports:
+            report = {
+                "shipping_date": shipping_date.isoformat(),
+                "total_packages": total_packages,
+                "total_invoice": f"{total_invoice:.2f}",
+            }
+            if include_duplicates:
+                report["duplicated_packages"] = duplicates
+            output.write(json.dumps(report) + "\n")
+    else:
+        for shipping_date, total_packages, total_invoice, duplicates in reports:
+            line = (
+                f"Company report for {shipping_date.isoformat()}: "
+                f"Total packages shipped: {total_packages}, Total invoice: {total_invoice:.2f}"
+            )
+            if include_duplicates:
+                line += f", Duplicated packages: {duplicates}"
+            output.write(line + "\n")
+
+
+def main(argv=None) -> int:
+    """
+    Run the command line report runner
+
+    :param List[str] argv: command line arguments, by default sys.argv is used
+    :return: exit status code
+    """
+    parser = _build_parser()
+    arguments = parser.parse_args(argv)
+    arguments.end_date = arguments.end_date or arguments.start_date
+
+    if arguments.end_date < arguments.start_date:
+        parser.error("end_date must be equal or after start_date")
+    if arguments.source == "file" and not arguments.input:
+        parser.error("--input is required for file source")
+    if arguments.source == "file" and not os.path.isfile(arguments.input):
+        parser.error(f"--input file not found: {arguments.input}")
+    if arguments.source == "generator" and arguments.input:
+        parser.error("--input is only allowed for file source")
+    if arguments.source == "file" and arguments.workers is not None:
+        parser.error("--workers is only allowed for generator source")
+    if arguments.workers is not None and arguments.workers < 1:
+        parser.error("--workers must be greater than 0")
+    if arguments.total_items < 0:
+        parser.error("--total-items must be equal or greater than 0")
+    arguments.workers = arguments.workers or 1
+
+    if arguments.source == "file":
+        reports = _iter_file_reports(arguments)
+    else:
+        reports = _iter_generator_reports(arguments)
+
+    try:
+        if arguments.output:
+            with open(
+                arguments.output,
+                "w",
+                buffering=OUTPUT_BUFFER_SIZE,
+                encoding="utf-8",
+                newline="",
+            ) as output:
+                _write_reports(
+                    reports, output, arguments.format, arguments.unique_tracking_codes
+                )
+        else:
+            _write_reports(
+                reports, sys.stdout, arguments.format, arguments.unique_tracking_codes
+            )
+            sys.stdout.flush()
+    except (OSError, ValueError) as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 1
+    return 0
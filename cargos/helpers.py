@@ -1,3 +1,4 @@
+import json
 import random
 from datetime import date, datetime
 from decimal import Decimal
@@ -8,6 +9,7 @@ from cargos.models import (
     CargoShipping,
     CargoShippingItem,
     City,
+    LazyCargoShipping,
 )
 
 
@@ -69,3 +71,173 @@ def generate_shipping_list(shipping_date, total_items=5, use_random_charges=Fals
     """
     for _ in range(total_items):
         yield _generate_next_shipping(shipping_date, use_random_charges)
+
+
+def deduplicate_shipping(shipping, tracking_index):
+    """
+    Register the packages of a cargo shipping in the tracking index as it's ingested, packages with a tracking code
+    already registered are counted as duplicates by the index. The ingested shipping isn't changed, a new shipping
+    without the duplicated packages is returned when there are any
+
+    :param CargoShipping shipping: ingested shipping
+    :param TrackingCodeIndex tracking_index: long-lived index shared by all ingested shipping
+    :return: CargoShipping
+    """
+    shipping_items = shipping.get_shipping_items()
+    unique_items = [
+        package
+        for package in shipping_items
+        if tracking_index.add(package.tracking_code)
+    ]
+    if len(unique_items) == len(shipping_items):
+        return shipping
+    return CargoShipping(
+        flight_number=shipping.flight_number,
+        shipping_date=shipping.shipping_date,
+        origin_city=shipping.origin_city,
+        destination_city=shipping.destination_city,
+        shipping_items=unique_items,
+    )
+
+
+def deduplicate_shipping_list(shipping_list, tracking_index):
+    """
+    Generate an iterator with cargo shipping whose packages were registered in the tracking index on ingest
+
+    :param Iterable[CargoShipping] shipping_list: cargos shipping to ingest
+    :param TrackingCodeIndex tracking_index: long-lived index shared by all ingested shipping
+    :return: CargoShipping iterator
+    """
+    for shipping in shipping_list:
+        yield deduplicate_shipping(shipping, tracking_index)
+
+
+def _build_shipping_items(raw_items):
+    """
+    Returns the shipping items built from their raw JSON values
+
+    :param List[dict] raw_items: packages with tracking_code and cargo_charge keys
+    """
+    return [
+        CargoShippingItem(
+            tracking_code=item["tracking_code"],
+            cargo_charge=Decimal(item["cargo_charge"]),
+        )
+        for item in raw_items
+    ]
+
+
+def _build_shipping_items_loader(file_path, offset):
+    """
+    Returns a callable that reads again the line at offset of the file and builds its shipping items, so raw
+    packages aren't kept in memory until they are requested
+
+    :param str file_path: path to the JSON lines file
+    :param int offset: position of the shipping line in the file
+    """
+
+    def load_shipping_items():
+        with open(file_path, "rb") as shipping_file:
+            shipping_file.seek(offset)
+            raw_shipping = json.loads(shipping_file.readline())
+        return _build_shipping_items(raw_shipping.get("shipping_items") or list())
+
+    return load_shipping_items
+
+
+def load_shipping_list_from_file(
+    file_path, tracking_index=None, get_tracking_index=None
+):
+    """
+    Generate an iterator with cargo shipping read from a JSON lines file, one shipping per line.
+
+    Each line has flight_number, shipping_date (ISO format), origin_city and destination_city (with id and name) and
+    shipping_items (with tracking_code and cargo_charge). Lines with total_packages and total_invoice keys are the
+    fast path: their packages are only read again from the file when requested. Without them, the totals are
+    calculated from every package of the line while it's read.
+
+    :param str file_path: path to the JSON lines file
+    :param TrackingCodeIndex tracking_index: long-lived index to register tracking codes on ingest, duplicated
+        packages are dropped and shipping are returned with their packages already built
+    :param callable get_tracking_index: receives the shipping date of each line and returns the TrackingCodeIndex to
+        register its tracking codes on ingest, e.g. an index by date, or None to keep the line lazy
+    :raises ValueError: if a line isn't a valid cargo shipping
+    :return: CargoShipping iterator
+    """
+    cities = dict()
+    offset = 0
+    with open(file_path, "rb") as shipping_file:
+        for line_number, line in enumerate(shipping_file, start=1):
+            line_offset, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                yield _parse_shipping_line(
+                    line,
+                    cities,
+                    file_path,
+                    line_offset,
+                    tracking_index,
+                    get_tracking_index,
+                )
+            except (ValueError, KeyError, TypeError) as error:
+                raise ValueError(
+                    f"{file_path}:{line_number}: invalid cargo shipping ({error!r})"
+                ) from error
+
+
+def _parse_shipping_line(
+    line, cities, file_path, offset, tracking_index, get_tracking_index
+):
+    """
+    Returns the cargo shipping for a JSON line of the file
+
+    :param bytes line: JSON line with the shipping
+    :param dict cities: City by id, shared by all lines of the file
+    :param str file_path: path to the JSON lines file
+    :param int offset: position of the line in the file
+    :param TrackingCodeIndex tracking_index: long-lived index to register tracking codes on ingest
+    :param callable get_tracking_index: receives the shipping date and returns the index to register tracking codes
+    """
+    raw_shipping = json.loads(line)
+
+    shipping_cities = []
+    for key in ("origin_city", "destination_city"):
+        raw_city = raw_shipping[key]
+        if raw_city["id"] not in cities:
+            cities[raw_city["id"]] = City(city_id=raw_city["id"], name=raw_city["name"])
+        shipping_cities.append(cities[raw_city["id"]])
+
+    shipping_values = dict(
+        flight_number=raw_shipping["flight_number"],
+        shipping_date=date.fromisoformat(raw_shipping["shipping_date"]),
+        origin_city=shipping_cities[0],
+        destination_city=shipping_cities[1],
+    )
+    raw_items = raw_shipping.get("shipping_items") or list()
+
+    if get_tracking_index is not None:
+        tracking_index = get_tracking_index(shipping_values["shipping_date"])
+    if tracking_index is not None:
+        unique_items = [
+            item for item in raw_items if tracking_index.add(item["tracking_code"])
+        ]
+        return CargoShipping(
+            shipping_items=_build_shipping_items(unique_items), **shipping_values
+        )
+
+    if "total_packages" in raw_shipping and "total_invoice" in raw_shipping:
+        total_packages = raw_shipping["total_packages"]
+        total_invoice = Decimal(raw_shipping["total_invoice"])
+    else:
+        total_packages = len(raw_items)
+        total_invoice = sum(
+            (Decimal(item["cargo_charge"]) for item in raw_items), Decimal("0")
+        )
+
+    return LazyCargoShipping(
+        total_packages=total_packages,
+        total_invoice=total_invoice,
+        shipping_items_loader=_build_shipping_items_loader(file_path, offset),
+        **shipping_values,
+    )
@@ -293,3 +293,124 @@ class CargoShipping:
         return len(shipping_items), sum(
             [package.cargo_charge for package in shipping_items]
         )
+
+
+class LazyCargoShipping(CargoShipping):
+    """
+    Represents a shipping whose packages are loaded on demand from its source.
+
+    Reports usually only need the date, route and totals of each shipping, so this variant carries the total
+    packages and total invoice precomputed by its source and only builds the list of CargoShippingItem when the
+    packages are requested or modified.
+
+    Usage:
+        - Initialize a lazy shipping with the same fields as CargoShipping, the precomputed totals and a callable
+          that returns the shipping items when invoked.
+        - :meth:`get_report_values_for_sales` returns the precomputed totals without loading packages.
+        - :meth:`get_shipping_items` and the mutators load the packages on first use, after that the instance
+          behaves as a regular CargoShipping.
+        - Use :meth:`is_hydrated` to check if the packages were already loaded.
+
+    Attributes:
+        _total_packages (int): Precomputed total of packages in the shipping.
+        _total_invoice (Decimal): Precomputed sum of cargo charges in the shipping.
+        _shipping_items_loader (callable): Callable returning the list of CargoShippingItem.
+
+    Examples:
+        Creating a LazyCargoShipping::
+
+            >>> cargo_shipping = LazyCargoShipping(
+                    flight_number="123456",
+                    shipping_date=date(2024, 3, 9),
+                    origin_city=origin_city,
+                    destination_city=destination_city,
+                    total_packages=1,
+                    total_invoice=Decimal("10.00"),
+                    shipping_items_loader=lambda: [shipping_item],
+                )
+
+        Retrieving report values without loading packages::
+
+            >>> cargo_shipping.get_report_values_for_sales()
+            (1, Decimal('10.00'))
+            >>> cargo_shipping.is_hydrated()
+            False
+    """
+
+    def __init__(
+        self,
+        flight_number,
+        shipping_date,
+        origin_city,
+        destination_city,
+        total_packages,
+        total_invoice,
+        shipping_items_loader,
+    ):
+        """
+        Inits the lazy cargo shipping instance
+
+        :param str flight_number: unique id for shipping
+        :param date shipping_date: date for current shipping
+        :param City origin_city: city for load packages
+        :param City destination_city: city for deliver packages
+        :param int total_packages: precomputed total of packages in the shipping
+        :param Decimal total_invoice: precomputed sum of cargo charges in the shipping
+        :param callable shipping_items_loader: callable returning the list of CargoShippingItem
+        """
+        super().__init__(flight_number, shipping_date, origin_city, destination_city)
+        self._shipping_items = None
+        self._total_packages = total_packages
+        self._total_invoice = total_invoice
+        self._shipping_items_loader = shipping_items_loader
+
+    def _hydrate(self):
+        """Loads the shipping items from the source if they weren't loaded yet"""
+        if self._shipping_items is None:
+            self._shipping_items = list(self._shipping_items_loader() or list())
+            self._shipping_items_loader = None
+
+    def is_hydrated(self) -> bool:
+        """Returns True if the shipping items were already loaded"""
+        return self._shipping_items is not None
+
+    def add_shipping_item(self, shipping_item):
+        """
+        Add a package to shipping items references, loading the packages first
+
+        :param CargoShippingItem shipping_item: package to add in shipping items list
+        """
+        self._hydrate()
+        super().add_shipping_item(shipping_item)
+
+    def remove_shipping_item(self, shipping_item):
+        """
+        Removes an existing package from shipping items references, loading the packages first
+
+        :param CargoShippingItem shipping_item: package to remove from shipping items list
+        """
+        self._hydrate()
+        super().remove_shipping_item(shipping_item)
+
+    def set_shipping_items(self, shipping_items):
+        """
+        Complete replace of shipping items references, the source is not loaded anymore
+
+        :param List[CargoShippingItem] shipping_items: list of packages to define as shipping items
+        """
+        self._shipping_items_loader = None
+        super().set_shipping_items(shipping_items)
+
+    def get_shipping_items(self):
+        """Returns the list of cargo shipping items, loading them from the source on first use
+
+        :return: List[CargoShippingItem]
+        """
+        self._hydrate()
+        return super().get_shipping_items()
+
+    def get_report_values_for_sales(self) -> Tuple[int, Decimal]:
+        """Returns the total packages and total invoice, using the precomputed values until packages are loaded"""
+        if not self.is_hydrated():
+            return self._total_packages, self._total_invoice
+        return super().get_report_values_for_sales()
@@ -1,11 +1,29 @@
+import heapq
 from decimal import Decimal
-from typing import Tuple
+from typing import Dict, List, Tuple
 
-from cargos.helpers import generate_shipping_list
+from cargos.helpers import (
+    deduplicate_shipping,
+    deduplicate_shipping_list,
+    generate_shipping_list,
+    load_shipping_list_from_file,
+)
+from cargos.sketches import CargoSketchReport, TrackingCodeIndex
+
+# functions returning the group key of a shipping for top revenue queries
+REVENUE_GROUPS = {
+    "flight": lambda shipping: shipping.flight_number,
+    "route": lambda shipping: (shipping.origin_city.id, shipping.destination_city.id),
+    "origin_city": lambda shipping: shipping.origin_city.id,
+}
 
 
 def get_cargo_invoices_report_for_date(
-    shipping_date, total_items=5, use_random_charges=False
+    shipping_date,
+    total_items=5,
+    use_random_charges=False,
+    unique_tracking_codes=False,
+    tracking_index=None,
 ) -> Tuple[int, Decimal]:
     """
     Check for shipping date and calculate total invoice and total packages
@@ -13,11 +31,21 @@ def get_cargo_invoices_report_for_date(
     :param datetime.date shipping_date: requested shipping date
     :param int total_items: allow to define a total of cargos shipping to process
     :param bool use_random_charges: allow to define if random charges will be used
+    :param bool unique_tracking_codes: allow to count and invoice each tracking code only once across shipping
+    :param TrackingCodeIndex tracking_index: long-lived index to register tracking codes on ingest, implies
+        unique_tracking_codes, keep it to share it between reports and to read the duplicates count
     """
+    if unique_tracking_codes and tracking_index is None:
+        tracking_index = TrackingCodeIndex(capacity=max(total_items, 1))
+
     # load fixture for shipping
     cargos_shipping_list = generate_shipping_list(
         shipping_date, total_items, use_random_charges
     )
+    if tracking_index is not None:
+        cargos_shipping_list = deduplicate_shipping_list(
+            cargos_shipping_list, tracking_index
+        )
 
     # filter cargos to get only valid shipping using shipping date
     shipping_list_to_process = [
@@ -39,6 +67,219 @@ def get_cargo_invoices_report_for_date(
     return total_packages, total_invoice
 
 
+def iter_cargo_invoices_reports_by_date(
+    shipping_list,
+    start_date,
+    end_date,
+    unique_tracking_codes=False,
+    get_tracking_index=None,
+):
+    """
+    Generate the total packages and total invoice for each shipping date in a range, each date is yielded as soon
+    as its shipping are finished, so only the current date is kept in memory. Shipping must be sorted by shipping
+    date and dates without shipping are not included
+
+    :param Iterable[CargoShipping] shipping_list: cargos shipping sorted by shipping date
+    :param datetime.date start_date: first shipping date to include
+    :param datetime.date end_date: last shipping date to include
+    :param bool unique_tracking_codes: allow to count and invoice each tracking code only once for each date
+    :param callable get_tracking_index: receives a shipping date and returns the index its tracking codes were
+        registered in on ingest, shipping are already deduplicated and only the duplicates count is read
+    :raises ValueError: if shipping aren't sorted by shipping date
+    :return: Iterator[Tuple[datetime.date, int, Decimal, int]] with date, total packages, total invoice and
+        duplicated packages
+    """
+    last_date = None
+    current_report = None
+    tracking_index = None
+
+    for shipping in shipping_list:
+        shipping_date = shipping.shipping_date
+        if last_date is not None and shipping_date < last_date:
+            raise ValueError(
+                f"Cargos shipping must be sorted by shipping date, {shipping_date} found after {last_date}"
+            )
+        last_date = shipping_date
+        if shipping_date < start_date:
+            continue
+        if shipping_date > end_date:
+            break
+
+        if current_report is None or current_report[0] != shipping_date:
+            if current_report is not None:
+                yield current_report
+            # the previous date index is released, the new one starts small and grows with the packages of the date
+            if get_tracking_index is not None:
+                tracking_index = get_tracking_index(shipping_date)
+            elif unique_tracking_codes:
+                tracking_index = TrackingCodeIndex()
+            current_report = (shipping_date, 0, Decimal("0"), 0)
+
+        if tracking_index is not None and get_tracking_index is None:
+            shipping = deduplicate_shipping(shipping, tracking_index)
+        shipping_packages, shipping_invoice = shipping.get_report_values_for_sales()
+        current_report = (
+            shipping_date,
+            current_report[1] + shipping_packages,
+            current_report[2] + shipping_invoice,
+            tracking_index.get_duplicates_count() if tracking_index else 0,
+        )
+
+    if current_report is not None:
+        yield current_report
+
+
+def iter_cargo_invoices_reports_from_file(
+    file_path, start_date, end_date, unique_tracking_codes=False
+):
+    """
+    Generate the total packages and total invoice for each shipping date in a range with a single pass over a JSON
+    lines file sorted by shipping date, see :func:`iter_cargo_invoices_reports_by_date`. With unique tracking codes
+    the packages of each line are deduplicated while the line is parsed, so lines are never read twice
+
+    :param str file_path: path to the JSON lines file, see :func:`load_shipping_list_from_file`
+    :param datetime.date start_date: first shipping date to include
+    :param datetime.date end_date: last shipping date to include
+    :param bool unique_tracking_codes: allow to count and invoice each tracking code only once for each date
+    :raises ValueError: if a line isn't a valid cargo shipping or shipping aren't sorted by shipping date
+    :return: Iterator[Tuple[datetime.date, int, Decimal, int]] with date, total packages, total invoice and
+        duplicated packages
+    """
+    if not unique_tracking_codes:
+        return iter_cargo_invoices_reports_by_date(
+            load_shipping_list_from_file(file_path), start_date, end_date
+        )
+
+    # only the index of the date being read is kept, lines out of the range stay lazy
+    tracking_indexes = dict()
+
+    def get_tracking_index(shipping_date):
+        if not start_date <= shipping_date <= end_date:
+            return None
+        if shipping_date not in tracking_indexes:
+            tracking_indexes.clear()
+            tracking_indexes[shipping_date] = TrackingCodeIndex()
+        return tracking_indexes[shipping_date]
+
+    return iter_cargo_invoices_reports_by_date(
+        load_shipping_list_from_file(file_path, get_tracking_index=get_tracking_index),
+        start_date,
+        end_date,
+        get_tracking_index=get_tracking_index,
+    )
+
+
+def _select_top_revenue(group_table, top) -> List[Tuple]:
+    """
+    Returns the top groups by total invoice using a heap bounded to top items
+
+    :param dict group_table: (total packages, total invoice) by group key
+    :param int top: total groups to return
+    :return: List[Tuple[key, int, Decimal]] sorted by total invoice, biggest first
+    """
+    top_groups = heapq.nlargest(top, group_table.items(), key=lambda group: group[1][1])
+    return [
+        (key, total_packages, total_invoice)
+        for key, (total_packages, total_invoice) in top_groups
+    ]
+
+
+def get_revenue_group_tables(
+    shipping_list, start_date, end_date=None, group_by=tuple(REVENUE_GROUPS)
+) -> Dict[str, Dict]:
+    """
+    Calculate total packages and total invoice of every group for a shipping date or range with a single pass over
+    shipping, tables from partitions of shipping can be combined with merge_top_revenue_groups
+
+    Flights are grouped by flight number, routes by (origin city id, destination city id) and origin cities by id.
+
+    :param Iterable[CargoShipping] shipping_list: cargos shipping to process
+    :param datetime.date start_date: first shipping date to include
+    :param datetime.date end_date: last shipping date to include, by default only start_date is included
+    :param Iterable[str] group_by: groups to calculate, keys of REVENUE_GROUPS
+    :raises ValueError: if a group_by name isn't a key of REVENUE_GROUPS
+    :return: Dict[str, Dict[key, Tuple[int, Decimal]]] (total packages, total invoice) by group key for each group_by
+    """
+    unknown_groups = [name for name in group_by if name not in REVENUE_GROUPS]
+    if unknown_groups:
+        raise ValueError(
+            f"Unknown revenue groups {unknown_groups}, valid groups are {list(REVENUE_GROUPS)}"
+        )
+
+    end_date = end_date or start_date
+    group_keys = {name: REVENUE_GROUPS[name] for name in group_by}
+    group_tables = {name: dict() for name in group_keys}
+
+    for shipping in shipping_list:
+        if not start_date <= shipping.shipping_date <= end_date:
+            continue
+
+        shipping_packages, shipping_invoice = shipping.get_report_values_for_sales()
+        for name, get_group_key in group_keys.items():
+            key = get_group_key(shipping)
+            total_packages, total_invoice = group_tables[name].get(
+                key, (0, Decimal("0"))
+            )
+            group_tables[name][key] = (
+                total_packages + shipping_packages,
+                total_invoice + shipping_invoice,
+            )
+
+    return group_tables
+
+
+def get_top_revenue_groups(
+    shipping_list, start_date, end_date=None, top=20, group_by=tuple(REVENUE_GROUPS)
+) -> Dict[str, List[Tuple]]:
+    """
+    Calculate the top groups by total invoice for a shipping date or range with a single pass over shipping
+
+    Memory is the table of groups plus the top items selected for each group, check get_revenue_group_tables for
+    the groups keys.
+
+    :param Iterable[CargoShipping] shipping_list: cargos shipping to process
+    :param datetime.date start_date: first shipping date to include
+    :param datetime.date end_date: last shipping date to include, by default only start_date is included
+    :param int top: total groups to return for each group_by
+    :param Iterable[str] group_by: groups to calculate, keys of REVENUE_GROUPS
+    :raises ValueError: if a group_by name isn't a key of REVENUE_GROUPS
+    :return: Dict[str, List[Tuple[key, int, Decimal]]] top groups for each group_by, biggest invoice first
+    """
+    group_tables = get_revenue_group_tables(
+        shipping_list, start_date, end_date, group_by
+    )
+    return {
+        name: _select_top_revenue(group_table, top)
+        for name, group_table in group_tables.items()
+    }
+
+
+def merge_top_revenue_groups(partial_group_tables, top=20) -> Dict[str, List[Tuple]]:
+    """
+    Merge the group tables calculated by get_revenue_group_tables over partitions of shipping and select the top
+    groups once, so the result is exact even when a group is present in several partitions
+
+    :param Iterable[Dict[str, Dict]] partial_group_tables: results of get_revenue_group_tables for each partition
+    :param int top: total groups to return for each group_by
+    :return: Dict[str, List[Tuple[key, int, Decimal]]] top groups for each group_by, biggest invoice first
+    """
+    group_tables = dict()
+    for partial_group_table in partial_group_tables:
+        for name, partial_table in partial_group_table.items():
+            group_table = group_tables.setdefault(name, dict())
+            for key, (shipping_packages, shipping_invoice) in partial_table.items():
+                total_packages, total_invoice = group_table.get(key, (0, Decimal("0")))
+                group_table[key] = (
+                    total_packages + shipping_packages,
+                    total_invoice + shipping_invoice,
+                )
+
+    return {
+        name: _select_top_revenue(group_table, top)
+        for name, group_table in group_tables.items()
+    }
+
+
 def print_cargo_report_for_date(shipping_date, total_items=5, use_random_charges=False):
     """
     Print a report for Airline total packages and shipping, you can optionally define a total of cargos shipping
@@ -54,3 +295,47 @@ def print_cargo_report_for_date(shipping_date, total_items=5, use_random_charges
     print("Company report:")
     print("Total packages shipped:", total_packages)
     print("Total invoice:", total_invoice)
+
+
+def build_cargo_sketch_report(
+    shipping_list, precision=12, relative_accuracy=0.01
+) -> CargoSketchReport:
+    """
+    Build an approximate report keeping mergeable sketches for each shipping date and route
+
+    :param Iterable[CargoShipping] shipping_list: cargos shipping to summarize
+    :param int precision: HyperLogLog precision, the distinct counts error is 1.04 / sqrt(2 ** precision)
+    :param float relative_accuracy: max relative error for cargo charges quantiles
+    """
+    report = CargoSketchReport(precision, relative_accuracy)
+    for shipping in shipping_list:
+        report.add_shipping(shipping)
+    return report
+
+
+def get_approximate_cargo_report_for_date(
+    shipping_date,
+    total_items=5,
+    use_random_charges=False,
+    precision=12,
+    relative_accuracy=0.01,
+) -> dict:
+    """
+    Build an approximate report for shipping date, with exact totals and estimated distinct counts and
+    cargo charges quantiles
+
+    :param datetime.date shipping_date: requested shipping date
+    :param int total_items: allow to define a total of cargos shipping to process
+    :param bool use_random_charges: allow to define if random charges will be used
+    :param int precision: HyperLogLog precision, the distinct counts error is 1.04 / sqrt(2 ** precision)
+    :param float relative_accuracy: max relative error for cargo charges quantiles
+    """
+    # load fixture for shipping
+    cargos_shipping_list = generate_shipping_list(
+        shipping_date, total_items, use_random_charges
+    )
+
+    report = build_cargo_sketch_report(
+        cargos_shipping_list, precision, relative_accuracy
+    )
+    return report.get_summary(shipping_date)
@@ -0,0 +1,746 @@
+# This file contains mergeable sketches for approximate reports over large cargo shipping histories
+
+import hashlib
+import math
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Tuple
+
+
+def hash64(value) -> int:
+    """Returns a stable 64 bits hash for the string representation of value"""
+    digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _registers_max(first, second) -> bytearray:
+    """
+    Returns the max of each register of two HyperLogLog with the same size, comparing all registers at once as big
+    integers, each register is below 128 so the high bit of each byte can't borrow from its neighbour
+
+    :param bytearray first: registers of the first sketch
+    :param bytearray second: registers of the second sketch
+    """
+    size = len(first)
+    first_value = int.from_bytes(first, "big")
+    second_value = int.from_bytes(second, "big")
+    high_bits = int.from_bytes(b"\x80" * size, "big")
+    # 0x80 on each byte where first >= second, expanded to 0xFF
+    first_is_bigger = (((first_value | high_bits) - second_value) & high_bits) >> 7
+    mask = first_is_bigger * 0xFF
+    result = (first_value & mask) | (second_value & ~mask)
+    return bytearray(result.to_bytes(size, "big"))
+
+
+class HyperLogLog:
+    """
+    Estimates the number of distinct values added using a fixed amount of memory.
+
+    The sketch keeps 2 ** precision one byte registers, so memory doesn't grow with the number of values and two
+    sketches with the same precision can be merged to count the union of their values. Registers are kept in a
+    sparse dict until 1/32 of them are used, so sketches with few values stay small.
+
+    Usage:
+        - Initialize the sketch with a precision between 4 and 16.
+        - Use methods to manage the sketch:
+            - :meth:`add`: Add a value to the sketch.
+            - :meth:`add_hash`: Add a value already hashed with 64 bits.
+            - :meth:`merge`: Add all values from other sketch with the same precision.
+            - :meth:`count`: Retrieve the estimated number of distinct values.
+            - :meth:`get_error_bound`: Retrieve the standard relative error of the estimation.
+
+    Attributes:
+        precision (int): Number of hash bits used to select a register.
+        _sparse (dict): Max leading zeros seen by register while the sketch is sparse, None after.
+        _registers (bytearray): Max leading zeros seen for each register once the sketch is dense, None before.
+
+    Examples:
+        Counting distinct tracking codes::
+
+            >>> sketch = HyperLogLog(precision=12)
+            >>> sketch.add("abcd")
+            >>> sketch.add("abcd")
+            >>> sketch.count()
+            1
+    """
+
+    def __init__(self, precision=12):
+        """
+        Inits the sketch
+
+        :param int precision: number of hash bits used to select a register, between 4 and 16
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16")
+        self.precision = precision
+        self._sparse: Dict[int, int] = dict()
+        self._registers = None
+
+    def _densify(self):
+        """Moves the sparse registers to a bytearray with every register"""
+        registers = bytearray(1 << self.precision)
+        for index, rank in self._sparse.items():
+            registers[index] = rank
+        self._registers = registers
+        self._sparse = None
+
+    def _update_register(self, index, rank):
+        """Keeps the max rank for the register at index"""
+        if self._registers is not None:
+            if rank > self._registers[index]:
+                self._registers[index] = rank
+        elif rank > self._sparse.get(index, 0):
+            self._sparse[index] = rank
+            if len(self._sparse) > (1 << self.precision) >> 5:
+                self._densify()
+
+    def add(self, value):
+        """
+        Add a value to the sketch
+
+        :param value: value to count, compared by its string representation
+        """
+        self.add_hash(hash64(value))
+
+    def add_hash(self, hashed):
+        """
+        Add a value to the sketch, so a value can be hashed once for several sketches
+
+        :param int hashed: 64 bits hash of the value, as returned by :func:`hash64`
+        """
+        index = hashed >> (64 - self.precision)
+        remaining = hashed & ((1 << (64 - self.precision)) - 1)
+        self._update_register(index, (64 - self.precision) - remaining.bit_length() + 1)
+
+    def merge(self, other):
+        """
+        Add all values counted by other sketch into current sketch
+
+        :param HyperLogLog other: sketch with the same precision
+        """
+        if other.precision != self.precision:
+            raise ValueError("Only HyperLogLog with the same precision can be merged")
+        if other._registers is None:
+            for index, rank in other._sparse.items():
+                self._update_register(index, rank)
+        elif self._registers is None:
+            sparse = self._sparse
+            self._registers = bytearray(other._registers)
+            self._sparse = None
+            for index, rank in sparse.items():
+                self._update_register(index, rank)
+        else:
+            self._registers = _registers_max(self._registers, other._registers)
+
+    def count(self) -> int:
+        """Returns the estimated number of distinct values added"""
+        total_registers = 1 << self.precision
+        if self._registers is None:
+            empty_registers = total_registers - len(self._sparse)
+            inverse_sum = empty_registers + sum(
+                2.0**-rank for rank in self._sparse.values()
+            )
+        else:
+            # counting each rank is done in C, instead of a python loop over every register
+            ranks_count = [
+                self._registers.count(rank) for rank in range(max(self._registers) + 1)
+            ]
+            empty_registers = ranks_count[0]
+            inverse_sum = sum(
+                total * 2.0**-rank for rank, total in enumerate(ranks_count)
+            )
+
+        alpha = 0.7213 / (1 + 1.079 / total_registers)
+        raw_estimate = alpha * total_registers**2 / inverse_sum
+        if raw_estimate <= 2.5 * total_registers and empty_registers:
+            # linear counting is more accurate for small cardinalities
+            return round(total_registers * math.log(total_registers / empty_registers))
+        return round(raw_estimate)
+
+    def get_error_bound(self) -> float:
+        """Returns the standard relative error of :meth:`count`"""
+        return 1.04 / math.sqrt(1 << self.precision)
+
+
+class QuantileSketch:
+    """
+    Estimates quantiles of non-negative values with a bounded relative error.
+
+    Values are counted in logarithmic buckets, so every quantile returned is within relative_accuracy of the exact
+    value and the number of buckets only depends on the ratio between the biggest and smallest values. Two sketches
+    with the same relative accuracy can be merged.
+
+    Usage:
+        - Initialize the sketch with the requested relative accuracy.
+        - Use methods to manage the sketch:
+            - :meth:`add`: Add a value to the sketch.
+            - :meth:`merge`: Add all values from other sketch with the same relative accuracy.
+            - :meth:`quantile`: Retrieve the estimated value for a quantile between 0 and 1.
+            - :meth:`get_error_bound`: Retrieve the relative error of the estimation.
+
+    Attributes:
+        relative_accuracy (float): Max relative error for quantiles.
+        count (int): Total values added.
+        _buckets (dict): Total values for each logarithmic bucket.
+        _zero_count (int): Total values equal to zero.
+
+    Examples:
+        Estimating the median cargo charge::
+
+            >>> sketch = QuantileSketch(relative_accuracy=0.01)
+            >>> sketch.add(Decimal("10.00"))
+            >>> sketch.quantile(0.5)
+            Decimal('10.074696689511331')
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Inits the sketch
+
+        :param float relative_accuracy: max relative error for quantiles, between 0 and 1
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("QuantileSketch relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = dict()
+        self._zero_count = 0
+
+    def add(self, value):
+        """
+        Add a value to the sketch
+
+        :param Decimal value: non-negative value to add
+        """
+        value = float(value)
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        if value == 0:
+            self._zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+
+    def merge(self, other):
+        """
+        Add all values counted by other sketch into current sketch
+
+        :param QuantileSketch other: sketch with the same relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                "Only QuantileSketch with the same relative accuracy can be merged"
+            )
+        for index, total in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + total
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q):
+        """
+        Returns the estimated value for the requested quantile, or None if the sketch is empty
+
+        :param float q: quantile between 0 and 1
+        :return: Decimal
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        accumulated = self._zero_count
+        if rank < accumulated:
+            return Decimal("0")
+        for index in sorted(self._buckets):
+            accumulated += self._buckets[index]
+            if rank < accumulated:
+                value = 2 * self._gamma**index / (self._gamma + 1)
+                return Decimal(repr(value))
+
+    def get_error_bound(self) -> float:
+        """Returns the relative error of :meth:`quantile`"""
+        return self.relative_accuracy
+
+
+def hash_shipping(shipping) -> Tuple[int, list]:
+    """
+    Returns the 64 bits hash of the flight number and the hashed tracking code and cargo charge of each package
+
+    :param CargoShipping shipping: shipping to hash
+    """
+    packages = [
+        (hash64(package.tracking_code), package.cargo_charge)
+        for package in shipping.get_shipping_items()
+    ]
+    return hash64(shipping.flight_number), packages
+
+
+def _next_month(day) -> date:
+    """Returns the first day of the month after day"""
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+class CargoSketch:
+    """
+    Summarizes a group of cargo shippings with exact totals and approximate distinct counts and charge quantiles.
+
+    Attributes:
+        total_packages (int): Exact total of packages.
+        total_invoice (Decimal): Exact sum of cargo charges.
+        tracking_codes (HyperLogLog): Sketch for distinct tracking codes.
+        flight_numbers (HyperLogLog): Sketch for distinct flight numbers.
+        cargo_charges (QuantileSketch): Sketch for cargo charges quantiles.
+    """
+
+    def __init__(self, precision=12, relative_accuracy=0.01):
+        """
+        Inits an empty cargo sketch
+
+        :param int precision: precision for HyperLogLog sketches
+        :param float relative_accuracy: relative accuracy for cargo charges quantiles
+        """
+        self.total_packages = 0
+        self.total_invoice = Decimal("0")
+        self.tracking_codes = HyperLogLog(precision)
+        self.flight_numbers = HyperLogLog(precision)
+        self.cargo_charges = QuantileSketch(relative_accuracy)
+
+    def add_shipping(self, shipping):
+        """
+        Add a cargo shipping and all its packages to the sketch
+
+        :param CargoShipping shipping: shipping to summarize
+        """
+        self.add_hashed_shipping(*hash_shipping(shipping))
+
+    def add_hashed_shipping(self, flight_hash, packages):
+        """
+        Add a cargo shipping already hashed by :func:`hash_shipping`, so it can be added to several sketches
+
+        :param int flight_hash: 64 bits hash of the flight number
+        :param List[Tuple[int, Decimal]] packages: 64 bits hash of the tracking code and cargo charge of each package
+        """
+        self.flight_numbers.add_hash(flight_hash)
+        for tracking_hash, cargo_charge in packages:
+            self.total_packages += 1
+            self.total_invoice += cargo_charge
+            self.tracking_codes.add_hash(tracking_hash)
+            self.cargo_charges.add(cargo_charge)
+
+    def check_mergeable(self, other):
+        """
+        Raises ValueError if other sketch wasn't built with the same precision and relative accuracy
+
+        :param CargoSketch other: sketch to check
+        """
+        if other.tracking_codes.precision != self.tracking_codes.precision:
+            raise ValueError("Only CargoSketch with the same precision can be merged")
+        if (
+            other.cargo_charges.relative_accuracy
+            != self.cargo_charges.relative_accuracy
+        ):
+            raise ValueError(
+                "Only CargoSketch with the same relative accuracy can be merged"
+            )
+
+    def merge(self, other):
+        """
+        Add all values summarized by other sketch into current sketch
+
+        :param CargoSketch other: sketch built with the same precision and relative accuracy
+        """
+        self.check_mergeable(other)
+        self.total_packages += other.total_packages
+        self.total_invoice += other.total_invoice
+        self.tracking_codes.merge(other.tracking_codes)
+        self.flight_numbers.merge(other.flight_numbers)
+        self.cargo_charges.merge(other.cargo_charges)
+
+
+class CargoSketchReport:
+    """
+    Keeps CargoSketch rollups by shipping date and route to answer approximate reports over large histories.
+
+    Each shipping is added to the sketch of its date and route, of its date, of its month and of its month and
+    route, so a range query merges the sketches of its whole months plus the days at its edges, a year is at most
+    12 months and 60 days instead of a sketch for each date and route. Memory is bounded by the number of dates and
+    routes, not by the number of packages, and reports built from different partitions of the history can be
+    merged.
+
+    Usage:
+        - Initialize the report with the sketches precision and relative accuracy.
+        - Use methods to manage the report:
+            - :meth:`add_shipping`: Add a CargoShipping to the sketches of its date, month and route.
+            - :meth:`merge`: Add all sketches from other report.
+            - :meth:`get_summary`: Retrieve the approximate report for a date or range of dates.
+
+    Attributes:
+        precision (int): Precision for HyperLogLog sketches.
+        relative_accuracy (float): Relative accuracy for cargo charges quantiles.
+        _sketches (dict): CargoSketch by rollup key, keys are (date, route), (date, None), ((year, month), route)
+            and ((year, month), None), route is the (origin, destination) cities ids.
+
+    Examples:
+        Building a report::
+
+            >>> report = CargoSketchReport()
+            >>> for shipping in shipping_list:
+            ...     report.add_shipping(shipping)
+            >>> summary = report.get_summary(date(2024, 3, 9))
+            >>> print(summary["total_invoice"], summary["distinct_tracking_codes"])
+            50 5
+    """
+
+    def __init__(self, precision=12, relative_accuracy=0.01):
+        """
+        Inits an empty report
+
+        :param int precision: precision for HyperLogLog sketches
+        :param float relative_accuracy: relative accuracy for cargo charges quantiles
+        """
+        self.precision = precision
+        self.relative_accuracy = relative_accuracy
+        self._sketches: Dict[Tuple, CargoSketch] = dict()
+
+    def _new_sketch(self) -> CargoSketch:
+        return CargoSketch(self.precision, self.relative_accuracy)
+
+    def _get_sketch(self, key) -> CargoSketch:
+        """Returns the sketch for a rollup key, creating it if it doesn't exist"""
+        if key not in self._sketches:
+            self._sketches[key] = self._new_sketch()
+        return self._sketches[key]
+
+    def add_shipping(self, shipping):
+        """
+        Add a cargo shipping to the sketches of its date, month and route
+
+        :param CargoShipping shipping: shipping to summarize
+        """
+        route = shipping.origin_city.id, shipping.destination_city.id
+        month = shipping.shipping_date.year, shipping.shipping_date.month
+        hashed_shipping = hash_shipping(shipping)
+        for key in (
+            (shipping.shipping_date, route),
+            (shipping.shipping_date, None),
+            (month, route),
+            (month, None),
+        ):
+            self._get_sketch(key).add_hashed_shipping(*hashed_shipping)
+
+    def merge(self, other):
+        """
+        Add all sketches from other report into current report
+
+        :param CargoSketchReport other: report built with the same precision and relative accuracy
+        """
+        # check before changing anything, so an invalid merge doesn't leave the report half merged
+        if (other.precision, other.relative_accuracy) != (
+            self.precision,
+            self.relative_accuracy,
+        ):
+            raise ValueError(
+                "Only CargoSketchReport with the same precision and relative accuracy can be merged"
+            )
+        for key, sketch in other._sketches.items():
+            self._get_sketch(key).merge(sketch)
+
+    def _iter_range_keys(self, start_date, end_date, route):
+        """Generate the fewest rollup keys covering the range, whole months use their month sketch"""
+        day = start_date
+        while day <= end_date:
+            next_month = _next_month(day)
+            if day.day == 1 and next_month - timedelta(days=1) <= end_date:
+                yield (day.year, day.month), route
+                day = next_month
+            else:
+                yield day, route
+                day += timedelta(days=1)
+
+    def get_summary(
+        self, start_date, end_date=None, route=None, quantiles=(0.5, 0.9, 0.99)
+    ) -> dict:
+        """
+        Returns the report for a date or range of dates, optionally filtered by route
+
+        Totals are exact, distinct counts and charge quantiles are estimations within the returned error bounds.
+
+        :param datetime.date start_date: first shipping date to include
+        :param datetime.date end_date: last shipping date to include, by default only start_date is included
+        :param tuple route: (origin city id, destination city id) to include, by default all routes are included
+        :param Iterable[float] quantiles: cargo charges quantiles to estimate
+        """
+        end_date = end_date or start_date
+        route = tuple(route) if route is not None else None
+        sketch = self._new_sketch()
+        for key in self._iter_range_keys(start_date, end_date, route):
+            if key in self._sketches:
+                sketch.merge(self._sketches[key])
+
+        return {
+            "total_packages": sketch.total_packages,
+            "total_invoice": sketch.total_invoice,
+            "distinct_tracking_codes": sketch.tracking_codes.count(),
+            "distinct_flights": sketch.flight_numbers.count(),
+            "cargo_charge_quantiles": {
+                q: sketch.cargo_charges.quantile(q) for q in quantiles
+            },
+            "distinct_count_error": sketch.tracking_codes.get_error_bound(),
+            "quantile_relative_error": sketch.cargo_charges.get_error_bound(),
+        }
+
+
+class BloomFilter:
+    """
+    Answers if a value was probably added, with no false negatives and a bounded false positive rate.
+
+    The filter is sized for the expected capacity and error rate, using about 9.6 bits per value for a 1% error
+    rate. Adding more values than the capacity is allowed, but the false positive rate grows.
+
+    Bits positions come from the built-in ``hash`` of the value, which is cached by strings and randomized for each
+    process, so a filter can't be persisted or merged with filters from other processes.
+
+    Usage:
+        - Initialize the filter with the expected capacity and the false positive rate.
+        - Use methods to manage the filter:
+            - :meth:`add`: Add a value to the filter, returns True if it was probably added before.
+            - ``value in bloom_filter``: Check if a value was probably added.
+
+    Attributes:
+        capacity (int): Expected total values to add.
+        error_rate (float): False positive rate when capacity values were added.
+        _size (int): Total bits in the filter.
+        _hashes (int): Total bits set for each value.
+        _bits (bytearray): Bits of the filter.
+
+    Examples:
+        Checking for tracking codes::
+
+            >>> bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+            >>> bloom_filter.add("abcd")
+            False
+            >>> "abcd" in bloom_filter
+            True
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Inits the filter
+
+        :param int capacity: expected total values to add
+        :param float error_rate: false positive rate when capacity values were added, between 0 and 1
+        """
+        if capacity <= 0:
+            raise ValueError("BloomFilter capacity must be greater than 0")
+        if not 0 < error_rate < 1:
+            raise ValueError("BloomFilter error rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, value):
+        """Generate the bits positions for value using double hashing over the two halves of its hash, lazily so a
+        lookup stops at the first unset bit"""
+        hashed = hash(value) & 0xFFFFFFFFFFFFFFFF
+        first_hash, second_hash = hashed & 0xFFFFFFFF, (hashed >> 32) | 1
+        size = self._size
+        for i in range(self._hashes):
+            yield (first_hash + i * second_hash) % size
+
+    def add(self, value) -> bool:
+        """
+        Add a value to the filter, returns True if the value was probably added before
+
+        :param value: hashable value to add
+        """
+        bits = self._bits
+        probably_added = True
+        for position in self._positions(value):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                probably_added = False
+                bits[position >> 3] |= mask
+        return probably_added
+
+    def __contains__(self, value) -> bool:
+        bits = self._bits
+        for position in self._positions(value):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class ScalableBloomFilter:
+    """
+    BloomFilter that keeps its false positive rate bounded while it grows past its initial capacity.
+
+    Values are added to the last of a stack of BloomFilter. When it's full, a new filter with four times its capacity
+    and half its error rate is stacked, so the compound false positive rate stays under error_rate whatever the total
+    values and filters are never rebuilt. Checking a value costs a lookup in each stacked filter, so a capacity near
+    the real total keeps the stack short. Tiny filters miss their error rate, so the first filter holds at least
+    MIN_CAPACITY values.
+
+    Usage:
+        - Initialize the filter with the initial capacity and the false positive rate.
+        - Use methods to manage the filter:
+            - :meth:`add`: Add a value to the filter, returns True if it was probably added before.
+            - ``value in bloom_filter``: Check if a value was probably added.
+
+    Attributes:
+        capacity (int): Total values to add to the first filter, at least MIN_CAPACITY.
+        error_rate (float): Maximum compound false positive rate.
+        _bloom_filters (List[BloomFilter]): Stacked filters, values are added to the last one.
+        _last_filter_count (int): Total values added to the last filter.
+
+    Examples:
+        Checking for tracking codes::
+
+            >>> bloom_filter = ScalableBloomFilter(capacity=1000, error_rate=0.01)
+            >>> bloom_filter.add("abcd")
+            False
+            >>> "abcd" in bloom_filter
+            True
+    """
+
+    # growth of capacity and tightening of error rate for each stacked filter
+    GROWTH_RATIO = 4
+    TIGHTENING_RATIO = 0.5
+    MIN_CAPACITY = 512
+
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Inits the filter
+
+        :param int capacity: expected total values to add to the first filter
+        :param float error_rate: maximum compound false positive rate, between 0 and 1
+        """
+        if capacity <= 0:
+            raise ValueError("BloomFilter capacity must be greater than 0")
+        if not 0 < error_rate < 1:
+            raise ValueError("BloomFilter error rate must be between 0 and 1")
+        self.capacity = max(capacity, self.MIN_CAPACITY)
+        self.error_rate = error_rate
+        # the error rates of the stacked filters are a geometric series whose sum is error_rate
+        self._bloom_filters = [
+            BloomFilter(self.capacity, error_rate * (1 - self.TIGHTENING_RATIO))
+        ]
+        self._last_filter_count = 0
+
+    def add(self, value) -> bool:
+        """
+        Add a value to the filter, returns True if the value was probably added before
+
+        :param value: hashable value to add
+        """
+        bloom_filters = self._bloom_filters
+        if self._last_filter_count >= bloom_filters[-1].capacity:
+            bloom_filters.append(
+                BloomFilter(
+                    bloom_filters[-1].capacity * self.GROWTH_RATIO,
+                    bloom_filters[-1].error_rate * self.TIGHTENING_RATIO,
+                )
+            )
+            self._last_filter_count = 0
+        for bloom_filter in bloom_filters[:-1]:
+            if value in bloom_filter:
+                return True
+        if bloom_filters[-1].add(value):
+            return True
+        self._last_filter_count += 1
+        return False
+
+    def __contains__(self, value) -> bool:
+        return any(value in bloom_filter for bloom_filter in self._bloom_filters)
+
+
+class TrackingCodeIndex:
+    """
+    Detects duplicated tracking codes across cargo shippings.
+
+    Each tracking code is checked against a ScalableBloomFilter, only codes the filter reports as probably seen are
+    confirmed against the exact store, so unique codes never pay a false duplicate. Past the capacity the filter
+    stacks bigger filters instead of being rebuilt, so the exact store is only checked, never iterated.
+
+    With the default in memory set, the filter costs ~1.2 bytes per code on top of the set and saves nothing. What
+    it buys is that the exact store only has to be checked for ~1% of new codes plus the real duplicates, so the
+    store can be slow and out of memory (a disk backed set, or the archive of already billed shipping) while memory
+    is only the filter. Use :meth:`get_exact_lookups_count` to check how many lookups reached the store.
+
+    Usage:
+        - Initialize the index with the expected total tracking codes and optionally an exact store.
+        - Keep the same index while ingesting shipping to detect duplicates across all of them.
+        - Use methods to manage the index:
+            - :meth:`add`: Register a tracking code, returns False if it was already registered.
+            - ``tracking_code in index``: Check if a tracking code was already registered.
+            - :meth:`get_duplicates_count`: Retrieve how many duplicated tracking codes were added.
+            - :meth:`get_exact_lookups_count`: Retrieve how many times the exact store was checked.
+
+    Attributes:
+        _bloom_filter (ScalableBloomFilter): Memory efficient front to discard new tracking codes.
+        _tracking_codes: Exact store of registered tracking codes, supports ``add``, ``in`` and ``len``.
+        _duplicates_count (int): Total duplicated tracking codes added.
+        _exact_lookups_count (int): Total times the exact store was checked.
+
+    Examples:
+        Registering tracking codes::
+
+            >>> index = TrackingCodeIndex()
+            >>> index.add("abcd")
+            True
+            >>> index.add("abcd")
+            False
+            >>> index.get_duplicates_count()
+            1
+    """
+
+    def __init__(self, capacity=1024, error_rate=0.01, exact_store=None):
+        """
+        Inits an empty index
+
+        :param int capacity: expected total tracking codes, the filter stacks bigger filters when it's exceeded
+        :param float error_rate: false positive rate for the BloomFilter front
+        :param exact_store: empty store for registered tracking codes, by default an in memory set
+        """
+        self._bloom_filter = ScalableBloomFilter(capacity, error_rate)
+        self._tracking_codes = set() if exact_store is None else exact_store
+        self._duplicates_count = 0
+        self._exact_lookups_count = 0
+
+    def add(self, tracking_code) -> bool:
+        """
+        Register a tracking code, returns True if it's new or False if it's a duplicate
+
+        :param str tracking_code: tracking code to register
+        """
+        # only codes the filter probably saw are confirmed against the exact store
+        if self._bloom_filter.add(tracking_code):
+            self._exact_lookups_count += 1
+            if tracking_code in self._tracking_codes:
+                self._duplicates_count += 1
+                return False
+        self._tracking_codes.add(tracking_code)
+        return True
+
+    def __contains__(self, tracking_code) -> bool:
+        return (
+            tracking_code in self._bloom_filter
+            and tracking_code in self._tracking_codes
+        )
+
+    def __len__(self) -> int:
+        return len(self._tracking_codes)
+
+    def get_duplicates_count(self) -> int:
+        """Returns the total duplicated tracking codes added"""
+        return self._duplicates_count
+
+    def get_exact_lookups_count(self) -> int:
+        """Returns the total times the exact store was checked because the BloomFilter probably saw the code"""
+        return self._exact_lookups_count
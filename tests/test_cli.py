@@ -0,0 +1,250 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from datetime import date
+from decimal import Decimal
+
+from cargos.cli import main
+
+
+class TestCommandLineRunnerFunctions(TestCase):
+    """Test case for evaluate all paths for the command line runner in cargos.cli"""
+
+    def setUp(self) -> None:
+        # Arrange common setup
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.temp_dir.name, "report.out")
+        self.input_path = os.path.join(self.temp_dir.name, "shipping.jsonl")
+        cities = {
+            "origin_city": {"id": 1, "name": "La Habana"},
+            "destination_city": {"id": 2, "name": "Buenos Aires"},
+        }
+        shipping_list = [
+            {
+                "flight_number": "FL-1",
+                "shipping_date": "2024-03-09",
+                "shipping_items": [
+                    {"tracking_code": "abcd", "cargo_charge": "10.00"},
+                    {"tracking_code": "efgh", "cargo_charge": "15.00"},
+                ],
+                **cities,
+            },
+            {
+                "flight_number": "FL-2",
+                "shipping_date": "2024-03-11",
+                "shipping_items": [{"tracking_code": "abcd", "cargo_charge": "10.00"}],
+                **cities,
+            },
+            {
+                "flight_number": "FL-3",
+                "shipping_date": "2024-03-11",
+                "shipping_items": [{"tracking_code": "abcd", "cargo_charge": "10.00"}],
+                **cities,
+            },
+        ]
+        with open(self.input_path, "w") as input_file:
+            for shipping in shipping_list:
+                input_file.write(json.dumps(shipping) + "\n")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _read_output(self):
+        with open(self.output_path) as output_file:
+            return output_file.read().splitlines()
+
+    def test_main__file_source_csv(self):
+        # Act
+        status = main(
+            [
+                "2024-03-09",
+                "2024-03-11",
+                "--source=file",
+                f"--input={self.input_path}",
+                "--format=csv",
+                f"--output={self.output_path}",
+            ]
+        )
+
+        # Asserts
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            self._read_output(),
+            [
+                "shipping_date,total_packages,total_invoice",
+                "2024-03-09,2,25.00",
+                "2024-03-10,0,0.00",
+                "2024-03-11,2,20.00",
+            ],
+        )
+
+    def test_main__file_source_unique_tracking_codes(self):
+        # Act
+        main(
+            [
+                "2024-03-11",
+                "--source=file",
+                f"--input={self.input_path}",
+                "--format=jsonl",
+                "--unique-tracking-codes",
+                f"--output={self.output_path}",
+            ]
+        )
+
+        # Asserts
+        self.assertEqual(
+            [json.loads(line) for line in self._read_output()],
+            [
+                {
+                    "shipping_date": "2024-03-11",
+                    "total_packages": 1,
+                    "total_invoice": "10.00",
+                    "duplicated_packages": 1,
+                }
+            ],
+        )
+
+    @mock.patch("cargos.services.get_cargo_invoices_report_for_date")
+    def test_main__generator_source_text(self, mock_get_invoice_report):
+        # Arrange
+        mock_get_invoice_report.return_value = 2, Decimal("20.00")
+
+        # Act
+        main(["2024-03-09", "2024-03-10", f"--output={self.output_path}"])
+
+        # Asserts
+        self.assertEqual(
+            self._read_output(),
+            [
+                "Company report for 2024-03-09: Total packages shipped: 2, Total invoice: 20.00",
+                "Company report for 2024-03-10: Total packages shipped: 2, Total invoice: 20.00",
+            ],
+        )
+        mock_get_invoice_report.assert_has_calls(
+            [
+                mock.call(
+                    date(2024, 3, 9),
+                    total_items=5,
+                    use_random_charges=False,
+                    tracking_index=None,
+                ),
+                mock.call(
+                    date(2024, 3, 10),
+                    total_items=5,
+                    use_random_charges=False,
+                    tracking_index=None,
+                ),
+            ]
+        )
+
+    def test_main__generator_source_workers(self):
+        # Act
+        main(
+            [
+                "2024-03-09",
+                "2024-03-12",
+                "--total-items=3",
+                "--workers=2",
+                "--format=csv",
+                f"--output={self.output_path}",
+            ]
+        )
+
+        # Asserts
+        self.assertEqual(
+            self._read_output()[1:],
+            [
+                "2024-03-09,3,30.00",
+                "2024-03-10,3,30.00",
+                "2024-03-11,3,30.00",
+                "2024-03-12,3,30.00",
+            ],
+        )
+
+    def test_main__generator_source_random_charges_two_decimals(self):
+        # Act
+        main(
+            [
+                "2024-03-09",
+                "--random-charges",
+                "--format=jsonl",
+                f"--output={self.output_path}",
+            ]
+        )
+
+        # Asserts
+        total_invoice = json.loads(self._read_output()[0])["total_invoice"]
+        self.assertRegex(total_invoice, r"^\d+\.\d{2}$")
+
+    def test_main__file_source_unsorted_shipping(self):
+        # Arrange
+        with open(self.input_path) as input_file:
+            lines = input_file.readlines()
+        with open(self.input_path, "w") as input_file:
+            input_file.writelines(reversed(lines))
+
+        # Act
+        with mock.patch("sys.stderr") as mock_stderr:
+            status = main(
+                [
+                    "2024-03-09",
+                    "2024-03-11",
+                    "--source=file",
+                    f"--input={self.input_path}",
+                    f"--output={self.output_path}",
+                ]
+            )
+
+        # Asserts
+        self.assertEqual(status, 1)
+        self.assertIn("sorted by shipping date", str(mock_stderr.write.call_args_list))
+
+    def test_main__file_source_invalid_line(self):
+        # Arrange
+        with open(self.input_path, "a") as input_file:
+            input_file.write("{not json\n")
+
+        # Act
+        with mock.patch("sys.stderr") as mock_stderr:
+            status = main(
+                [
+                    "2024-03-09",
+                    "2024-03-11",
+                    "--source=file",
+                    f"--input={self.input_path}",
+                    f"--output={self.output_path}",
+                ]
+            )
+
+        # Asserts
+        self.assertEqual(status, 1)
+        self.assertIn(
+            ":4: invalid cargo shipping", str(mock_stderr.write.call_args_list)
+        )
+
+    @mock.patch("sys.stderr")
+    def test_main__invalid_arguments(self, mock_stderr):
+        # Act & Asserts
+        with self.assertRaises(SystemExit):
+            main(["2024-03-10", "2024-03-09"])
+        with self.assertRaises(SystemExit):
+            main(["2024-03-09", "--source=file"])
+        with self.assertRaises(SystemExit):
+            main(["2024-03-09", "--workers=0"])
+        with self.assertRaises(SystemExit):
+            main(["2024-03-09", "--source=file", "--input=/nonexistent"])
+        with self.assertRaises(SystemExit):
+            main(["2024-03-09", "--total-items=-1"])
+        with self.assertRaises(SystemExit):
+            main(["2024-03-09", f"--input={self.input_path}"])
+        with self.assertRaises(SystemExit):
+            main(
+                [
+                    "2024-03-09",
+                    "--source=file",
+                    f"--input={self.input_path}",
+                    "--workers=2",
+                ]
+            )
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from datetime import date
+from decimal import Decimal
+
+from cargos.helpers import load_shipping_list_from_file
+from cargos.models import CargoShipping, LazyCargoShipping
+from cargos.sketches import TrackingCodeIndex
+
+
+class TestLoadShippingListFromFileFunctions(TestCase):
+    """Test case for evaluate all paths for load CargoShipping from a JSON lines file"""
+
+    def setUp(self) -> None:
+        # Arrange common setup
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.temp_dir.name, "shipping.jsonl")
+        shipping = {
+            "flight_number": "FL-1",
+            "shipping_date": "2024-03-09",
+            "origin_city": {"id": 1, "name": "La Habana"},
+            "destination_city": {"id": 2, "name": "Buenos Aires"},
+            "total_packages": 2,
+            "total_invoice": "25.00",
+            "shipping_items": [
+                {"tracking_code": "abcd", "cargo_charge": "10.00"},
+                {"tracking_code": "efgh", "cargo_charge": "15.00"},
+            ],
+        }
+        with open(self.input_path, "w") as input_file:
+            input_file.write(json.dumps(shipping) + "\n\n")
+            input_file.write(json.dumps(shipping) + "\n")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_load_shipping_list_from_file__precomputed_totals(self):
+        # Act
+        shipping_list = list(load_shipping_list_from_file(self.input_path))
+
+        # Asserts
+        self.assertEqual(len(shipping_list), 2)
+        self.assertEqual(shipping_list[1].shipping_date, date(2024, 3, 9))
+        self.assertIs(shipping_list[0].origin_city, shipping_list[1].origin_city)
+        self.assertEqual(
+            shipping_list[1].get_report_values_for_sales(), (2, Decimal("25.00"))
+        )
+        self.assertFalse(shipping_list[1].is_hydrated())
+
+    def test_load_shipping_list_from_file__hydrates_from_file(self):
+        # Act
+        shipping = list(load_shipping_list_from_file(self.input_path))[1]
+        shipping_items = shipping.get_shipping_items()
+
+        # Asserts
+        self.assertEqual(
+            [(item.tracking_code, item.cargo_charge) for item in shipping_items],
+            [("abcd", Decimal("10.00")), ("efgh", Decimal("15.00"))],
+        )
+
+    def test_load_shipping_list_from_file__tracking_index(self):
+        # Arrange
+        tracking_index = TrackingCodeIndex()
+
+        # Act
+        shipping_list = list(
+            load_shipping_list_from_file(self.input_path, tracking_index)
+        )
+
+        # Asserts
+        self.assertEqual(
+            shipping_list[0].get_report_values_for_sales(), (2, Decimal("25.00"))
+        )
+        self.assertEqual(shipping_list[1].get_report_values_for_sales()[0], 0)
+        self.assertEqual(tracking_index.get_duplicates_count(), 2)
+
+    def test_load_shipping_list_from_file__get_tracking_index(self):
+        # Arrange
+        tracking_indexes = [TrackingCodeIndex(), None]
+
+        # Act
+        shipping_list = list(
+            load_shipping_list_from_file(
+                self.input_path,
+                get_tracking_index=lambda shipping_date: tracking_indexes.pop(0),
+            )
+        )
+
+        # Asserts
+        self.assertIsInstance(shipping_list[0], CargoShipping)
+        self.assertIsInstance(shipping_list[1], LazyCargoShipping)
+        self.assertFalse(shipping_list[1].is_hydrated())
+        self.assertEqual(
+            shipping_list[1].get_report_values_for_sales(), (2, Decimal("25.00"))
+        )
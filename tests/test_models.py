@@ -3,7 +3,13 @@ from unittest import TestCase
 from datetime import date
 from decimal import Decimal
 
-from cargos.models import CargoSetting, CargoShipping, CargoShippingItem, City
+from cargos.models import (
+    CargoSetting,
+    CargoShipping,
+    CargoShippingItem,
+    City,
+    LazyCargoShipping,
+)
 
 
 class TestCityFunctions(TestCase):
@@ -254,3 +260,99 @@ class TestCargoShippingFunctions(TestCase):
         # Asserts
         self.assertEqual(total_packages, 2)
         self.assertEqual(total_invoice, Decimal("25.00"))
+
+
+class TestLazyCargoShippingFunctions(TestCase):
+    """Test case for evaluate all functions in the model cargos.models.LazyCargoShipping"""
+
+    def setUp(self) -> None:
+        # Arrange common setup
+        self.origin_city = City(1, "La Habana")
+        self.destination_city = City(2, "Buenos Aires")
+        self.package1 = CargoShippingItem("abcd", Decimal("10.00"))
+        self.package2 = CargoShippingItem("efgh", Decimal("15.00"))
+        self.shipping_date = date(2024, 3, 9)
+        self.loader_calls = 0
+
+    def _loader(self):
+        self.loader_calls += 1
+        return [self.package1, self.package2]
+
+    def _build_lazy_shipping(self):
+        return LazyCargoShipping(
+            "FL-12345",
+            self.shipping_date,
+            self.origin_city,
+            self.destination_city,
+            total_packages=2,
+            total_invoice=Decimal("25.00"),
+            shipping_items_loader=self._loader,
+        )
+
+    def test_report_values_for_sales_without_hydration(self):
+        # Arrange
+        cargo_shipping = self._build_lazy_shipping()
+
+        # Act
+        total_packages, total_invoice = cargo_shipping.get_report_values_for_sales()
+
+        # Asserts
+        self.assertEqual(total_packages, 2)
+        self.assertEqual(total_invoice, Decimal("25.00"))
+        self.assertFalse(cargo_shipping.is_hydrated())
+        self.assertEqual(self.loader_calls, 0)
+
+    def test_get_shipping_items_hydrates_once(self):
+        # Arrange
+        cargo_shipping = self._build_lazy_shipping()
+
+        # Act
+        cargo_shipping.get_shipping_items()
+        shipping_items = cargo_shipping.get_shipping_items()
+
+        # Asserts
+        self.assertEqual(shipping_items, [self.package1, self.package2])
+        self.assertTrue(cargo_shipping.is_hydrated())
+        self.assertEqual(self.loader_calls, 1)
+
+    def test_add_package_hydrates(self):
+        # Arrange
+        cargo_shipping = self._build_lazy_shipping()
+        package3 = CargoShippingItem("ijkl", Decimal("5.00"))
+
+        # Act
+        cargo_shipping.add_shipping_item(package3)
+        total_packages, total_invoice = cargo_shipping.get_report_values_for_sales()
+
+        # Asserts
+        self.assertEqual(
+            cargo_shipping.get_shipping_items(),
+            [self.package1, self.package2, package3],
+        )
+        self.assertEqual(total_packages, 3)
+        self.assertEqual(total_invoice, Decimal("30.00"))
+
+    def test_remove_package_hydrates(self):
+        # Arrange
+        cargo_shipping = self._build_lazy_shipping()
+
+        # Act
+        cargo_shipping.remove_shipping_item(self.package1)
+
+        # Asserts
+        self.assertEqual(cargo_shipping.get_shipping_items(), [self.package2])
+        self.assertEqual(self.loader_calls, 1)
+
+    def test_set_shipping_items_skips_source(self):
+        # Arrange
+        cargo_shipping = self._build_lazy_shipping()
+
+        # Act
+        cargo_shipping.set_shipping_items([self.package1])
+        total_packages, total_invoice = cargo_shipping.get_report_values_for_sales()
+
+        # Asserts
+        self.assertEqual(cargo_shipping.get_shipping_items(), [self.package1])
+        self.assertEqual(total_packages, 1)
+        self.assertEqual(total_invoice, Decimal("10.00"))
+        self.assertEqual(self.loader_calls, 0)
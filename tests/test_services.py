@@ -1,10 +1,21 @@
+import json
+import os
+import tempfile
 from unittest import TestCase, mock
 
 from datetime import date
 from decimal import Decimal
 
+from cargos.models import CargoShipping, CargoShippingItem, City
+from cargos.sketches import TrackingCodeIndex
 from cargos.services import (
+    get_approximate_cargo_report_for_date,
     get_cargo_invoices_report_for_date,
+    get_revenue_group_tables,
+    get_top_revenue_groups,
+    iter_cargo_invoices_reports_by_date,
+    iter_cargo_invoices_reports_from_file,
+    merge_top_revenue_groups,
     print_cargo_report_for_date,
 )
 
@@ -55,10 +66,382 @@ class TestGetCargoInvoiceReportFunctions(TestCase):
         mock_get_shipping_list.assert_called_with(shipping_date, 5, False)
         mock_shipping.get_report_values_for_sales.assert_called_once()
 
+    def test_get_cargo_invoices_report_for_date__unique_tracking_codes(
+        self, mock_get_shipping_list
+    ):
+        # Arrange
+        shipping_date = date(2024, 3, 9)
+        origin_city, destination_city = City(1, "La Habana"), City(2, "Buenos Aires")
+        shipping1 = CargoShipping(
+            "FL-1",
+            shipping_date,
+            origin_city,
+            destination_city,
+            [
+                CargoShippingItem("abcd", Decimal("10.00")),
+                CargoShippingItem("efgh", Decimal("15.00")),
+            ],
+        )
+        shipping2 = CargoShipping(
+            "FL-2",
+            shipping_date,
+            origin_city,
+            destination_city,
+            [CargoShippingItem("abcd", Decimal("10.00"))],
+        )
+        mock_get_shipping_list.return_value = [shipping1, shipping2]
+
+        # Act
+        total_packages, total_invoice = get_cargo_invoices_report_for_date(
+            shipping_date, unique_tracking_codes=True
+        )
+
+        # Asserts
+        self.assertEqual(total_packages, 2)
+        self.assertEqual(total_invoice, Decimal("25.00"))
+        mock_get_shipping_list.assert_called_with(shipping_date, 5, False)
+
+    def test_get_cargo_invoices_report_for_date__shared_tracking_index(
+        self, mock_get_shipping_list
+    ):
+        # Arrange
+        origin_city, destination_city = City(1, "La Habana"), City(2, "Buenos Aires")
+        mock_get_shipping_list.side_effect = lambda shipping_date, *args: [
+            CargoShipping(
+                "FL-1",
+                shipping_date,
+                origin_city,
+                destination_city,
+                [CargoShippingItem("abcd", Decimal("10.00"))],
+            )
+        ]
+        tracking_index = TrackingCodeIndex()
+
+        # Act
+        first_report = get_cargo_invoices_report_for_date(
+            date(2024, 3, 9), tracking_index=tracking_index
+        )
+        second_report = get_cargo_invoices_report_for_date(
+            date(2024, 3, 10), tracking_index=tracking_index
+        )
+
+        # Asserts
+        self.assertEqual(first_report, (1, Decimal("10.00")))
+        self.assertEqual(second_report, (0, Decimal("0")))
+        self.assertEqual(tracking_index.get_duplicates_count(), 1)
+
+
+class TestIterCargoInvoiceReportsByDateFunctions(TestCase):
+    """Test case for evaluate all paths for stream CargoShipping reports for a range of shipping dates"""
+
+    def setUp(self) -> None:
+        # Arrange common setup
+        self.origin_city = City(1, "La Habana")
+        self.destination_city = City(2, "Buenos Aires")
+
+    def _build_shipping(self, shipping_date, codes):
+        return CargoShipping(
+            "FL-12345",
+            shipping_date,
+            self.origin_city,
+            self.destination_city,
+            [CargoShippingItem(code, Decimal("10.00")) for code in codes],
+        )
+
+    def test_iter_cargo_invoices_reports_by_date__valid_results(self):
+        # Arrange
+        shipping_list = [
+            self._build_shipping(date(2024, 3, 8), ["a"]),
+            self._build_shipping(date(2024, 3, 9), ["b", "c"]),
+            self._build_shipping(date(2024, 3, 9), ["b"]),
+            self._build_shipping(date(2024, 3, 11), ["d"]),
+            self._build_shipping(date(2024, 3, 12), ["e"]),
+        ]
+
+        # Act
+        reports = iter_cargo_invoices_reports_by_date(
+            shipping_list, date(2024, 3, 9), date(2024, 3, 11)
+        )
+
+        # Asserts
+        self.assertEqual(
+            list(reports),
+            [
+                (date(2024, 3, 9), 3, Decimal("30.00"), 0),
+                (date(2024, 3, 11), 1, Decimal("10.00"), 0),
+            ],
+        )
+
+    def test_iter_cargo_invoices_reports_by_date__streams_finished_dates(self):
+        # Arrange
+        def iter_shipping_list():
+            yield self._build_shipping(date(2024, 3, 9), ["a"])
+            yield self._build_shipping(date(2024, 3, 10), ["b"])
+            raise AssertionError("shipping read before it was needed")
+
+        # Act
+        reports = iter_cargo_invoices_reports_by_date(
+            iter_shipping_list(), date(2024, 3, 9), date(2024, 3, 11)
+        )
+
+        # Asserts
+        self.assertEqual(next(reports), (date(2024, 3, 9), 1, Decimal("10.00"), 0))
+
+    def test_iter_cargo_invoices_reports_by_date__unique_tracking_codes(self):
+        # Arrange
+        shipping_list = [
+            self._build_shipping(date(2024, 3, 9), ["b", "c"]),
+            self._build_shipping(date(2024, 3, 9), ["b"]),
+            self._build_shipping(date(2024, 3, 10), ["b"]),
+        ]
+
+        # Act
+        reports = iter_cargo_invoices_reports_by_date(
+            shipping_list, date(2024, 3, 9), date(2024, 3, 10), True
+        )
+
+        # Asserts
+        self.assertEqual(
+            list(reports),
+            [
+                (date(2024, 3, 9), 2, Decimal("20.00"), 1),
+                (date(2024, 3, 10), 1, Decimal("10.00"), 0),
+            ],
+        )
+
+    def test_iter_cargo_invoices_reports_by_date__unique_keeps_shipping(self):
+        # Arrange
+        shipping_list = [
+            self._build_shipping(date(2024, 3, 9), ["b", "c"]),
+            self._build_shipping(date(2024, 3, 9), ["b", "d"]),
+        ]
+
+        # Act
+        list(
+            iter_cargo_invoices_reports_by_date(
+                shipping_list, date(2024, 3, 9), date(2024, 3, 9), True
+            )
+        )
+        reports = iter_cargo_invoices_reports_by_date(
+            shipping_list, date(2024, 3, 9), date(2024, 3, 9)
+        )
+
+        # Asserts
+        self.assertEqual(
+            [
+                package.tracking_code
+                for package in shipping_list[1].get_shipping_items()
+            ],
+            ["b", "d"],
+        )
+        self.assertEqual(list(reports), [(date(2024, 3, 9), 4, Decimal("40.00"), 0)])
+
+    def test_iter_cargo_invoices_reports_by_date__unsorted_shipping(self):
+        # Arrange
+        shipping_list = [
+            self._build_shipping(date(2024, 3, 10), ["a"]),
+            self._build_shipping(date(2024, 3, 9), ["b"]),
+        ]
+
+        # Act & Asserts
+        with self.assertRaises(ValueError):
+            list(
+                iter_cargo_invoices_reports_by_date(
+                    shipping_list, date(2024, 3, 9), date(2024, 3, 10)
+                )
+            )
+
+
+class TestIterCargoInvoiceReportsFromFileFunctions(TestCase):
+    """Test case for evaluate all paths for stream CargoShipping reports from a JSON lines file"""
+
+    def setUp(self) -> None:
+        # Arrange common setup
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.temp_dir.name, "shipping.jsonl")
+        with open(self.input_path, "w") as input_file:
+            for shipping_date, codes in (
+                ("2024-03-08", ["a"]),
+                ("2024-03-09", ["b", "c"]),
+                ("2024-03-09", ["b"]),
+                ("2024-03-10", ["b"]),
+            ):
+                shipping = {
+                    "flight_number": "FL-1",
+                    "shipping_date": shipping_date,
+                    "origin_city": {"id": 1, "name": "La Habana"},
+                    "destination_city": {"id": 2, "name": "Buenos Aires"},
+                    "total_packages": len(codes),
+                    "total_invoice": f"{len(codes) * 10}.00",
+                    "shipping_items": [
+                        {"tracking_code": code, "cargo_charge": "10.00"}
+                        for code in codes
+                    ],
+                }
+                input_file.write(json.dumps(shipping) + "\n")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_iter_cargo_invoices_reports_from_file__valid_results(self):
+        # Act
+        reports = iter_cargo_invoices_reports_from_file(
+            self.input_path, date(2024, 3, 9), date(2024, 3, 10)
+        )
+
+        # Asserts
+        self.assertEqual(
+            list(reports),
+            [
+                (date(2024, 3, 9), 3, Decimal("30.00"), 0),
+                (date(2024, 3, 10), 1, Decimal("10.00"), 0),
+            ],
+        )
+
+    def test_iter_cargo_invoices_reports_from_file__unique_parses_lines_once(self):
+        # Act
+        with mock.patch("cargos.helpers.json.loads", wraps=json.loads) as mock_loads:
+            reports = list(
+                iter_cargo_invoices_reports_from_file(
+                    self.input_path, date(2024, 3, 9), date(2024, 3, 10), True
+                )
+            )
+
+        # Asserts
+        self.assertEqual(
+            reports,
+            [
+                (date(2024, 3, 9), 2, Decimal("20.00"), 1),
+                (date(2024, 3, 10), 1, Decimal("10.00"), 0),
+            ],
+        )
+        self.assertEqual(mock_loads.call_count, 4)
+
+
+class TestGetTopRevenueGroupsFunctions(TestCase):
+    """Test case for evaluate all paths for get top revenue groups of CargoShipping"""
+
+    def setUp(self) -> None:
+        # Arrange common setup
+        self.city1 = City(1, "La Habana")
+        self.city2 = City(2, "Buenos Aires")
+        self.city3 = City(3, "Brasilia")
+        self.shipping_list = [
+            self._build_shipping("FL-1", date(2024, 3, 9), self.city1, self.city2, 3),
+            self._build_shipping("FL-2", date(2024, 3, 9), self.city1, self.city3, 1),
+            self._build_shipping("FL-3", date(2024, 3, 9), self.city2, self.city3, 2),
+            self._build_shipping("FL-4", date(2024, 3, 10), self.city2, self.city3, 5),
+        ]
+
+    def _build_shipping(self, flight_number, shipping_date, origin, destination, total):
+        return CargoShipping(
+            flight_number,
+            shipping_date,
+            origin,
+            destination,
+            [
+                CargoShippingItem(f"{flight_number}-{code}", Decimal("10.00"))
+                for code in range(total)
+            ],
+        )
+
+    def test_get_top_revenue_groups__for_date(self):
+        # Act
+        top_groups = get_top_revenue_groups(self.shipping_list, date(2024, 3, 9), top=2)
+
+        # Asserts
+        self.assertEqual(
+            top_groups,
+            {
+                "flight": [
+                    ("FL-1", 3, Decimal("30.00")),
+                    ("FL-3", 2, Decimal("20.00")),
+                ],
+                "route": [
+                    ((1, 2), 3, Decimal("30.00")),
+                    ((2, 3), 2, Decimal("20.00")),
+                ],
+                "origin_city": [
+                    (1, 4, Decimal("40.00")),
+                    (2, 2, Decimal("20.00")),
+                ],
+            },
+        )
+
+    def test_get_top_revenue_groups__for_range_and_group(self):
+        # Act
+        top_groups = get_top_revenue_groups(
+            self.shipping_list,
+            date(2024, 3, 9),
+            date(2024, 3, 10),
+            top=1,
+            group_by=["route"],
+        )
+
+        # Asserts
+        self.assertEqual(top_groups, {"route": [((2, 3), 7, Decimal("70.00"))]})
+
+    def test_get_top_revenue_groups__empty_result(self):
+        # Act
+        top_groups = get_top_revenue_groups(self.shipping_list, date(2024, 3, 11))
+
+        # Asserts
+        self.assertEqual(top_groups, {"flight": [], "route": [], "origin_city": []})
+
+    def test_get_top_revenue_groups__unknown_group(self):
+        # Act & Asserts
+        with self.assertRaisesRegex(ValueError, "valid groups"):
+            get_top_revenue_groups(
+                self.shipping_list, date(2024, 3, 9), group_by=["destination_city"]
+            )
+
+    def test_merge_top_revenue_groups(self):
+        # Arrange
+        partial_group_tables = [
+            get_revenue_group_tables(
+                self.shipping_list[:2], date(2024, 3, 9), date(2024, 3, 10)
+            ),
+            get_revenue_group_tables(
+                self.shipping_list[2:], date(2024, 3, 9), date(2024, 3, 10)
+            ),
+        ]
+
+        # Act
+        top_groups = merge_top_revenue_groups(partial_group_tables, top=2)
+
+        # Asserts
+        self.assertEqual(
+            top_groups["flight"],
+            [("FL-4", 5, Decimal("50.00")), ("FL-1", 3, Decimal("30.00"))],
+        )
+        self.assertEqual(
+            top_groups["origin_city"],
+            [(2, 7, Decimal("70.00")), (1, 4, Decimal("40.00"))],
+        )
+
+    def test_merge_top_revenue_groups__group_in_several_partitions(self):
+        # Arrange
+        shipping_list = [
+            self._build_shipping("FL-1", date(2024, 3, 9), self.city1, self.city2, 2),
+            self._build_shipping("FL-2", date(2024, 3, 9), self.city1, self.city3, 3),
+            self._build_shipping("FL-1", date(2024, 3, 10), self.city1, self.city2, 2),
+            self._build_shipping("FL-3", date(2024, 3, 10), self.city2, self.city3, 3),
+        ]
+        partial_group_tables = [
+            get_revenue_group_tables(shipping_list[:2], date(2024, 3, 9)),
+            get_revenue_group_tables(shipping_list[2:], date(2024, 3, 10)),
+        ]
+
+        # Act
+        top_groups = merge_top_revenue_groups(partial_group_tables, top=1)
+
+        # Asserts
+        self.assertEqual(top_groups["flight"], [("FL-1", 4, Decimal("40.00"))])
+
 
 @mock.patch("builtins.print")
 @mock.patch("cargos.services.get_cargo_invoices_report_for_date")
-class TestGetCargoInvoiceReportFunctions(TestCase):
+class TestPrintCargoReportFunctions(TestCase):
     """Test case for evaluate all paths for get CargoShipping reports print for custom shipping dates"""
 
     def test_print_cargo_report_for_date__valid_results(
@@ -80,3 +463,49 @@ class TestGetCargoInvoiceReportFunctions(TestCase):
                 mock.call("Total invoice:", Decimal("20.00")),
             ]
         )
+
+
+@mock.patch("cargos.services.generate_shipping_list")
+class TestGetApproximateCargoReportFunctions(TestCase):
+    """Test case for evaluate all paths for get approximate CargoShipping reports for custom shipping dates"""
+
+    def test_get_approximate_cargo_report_for_date__valid_results(
+        self, mock_get_shipping_list
+    ):
+        # Arrange
+        shipping_date = date(2024, 3, 9)
+        shipping = CargoShipping(
+            "FL-12345",
+            shipping_date,
+            City(1, "La Habana"),
+            City(2, "Buenos Aires"),
+            [
+                CargoShippingItem("abcd", Decimal("10.00")),
+                CargoShippingItem("efgh", Decimal("15.00")),
+            ],
+        )
+        mock_get_shipping_list.return_value = [shipping]
+
+        # Act
+        summary = get_approximate_cargo_report_for_date(shipping_date)
+
+        # Asserts
+        self.assertEqual(summary["total_packages"], 2)
+        self.assertEqual(summary["total_invoice"], Decimal("25.00"))
+        self.assertEqual(summary["distinct_tracking_codes"], 2)
+        self.assertEqual(summary["distinct_flights"], 1)
+        mock_get_shipping_list.assert_called_with(shipping_date, 5, False)
+
+    def test_get_approximate_cargo_report_for_date__empty_result(
+        self, mock_get_shipping_list
+    ):
+        # Arrange
+        mock_get_shipping_list.return_value = []
+
+        # Act
+        summary = get_approximate_cargo_report_for_date(date(2024, 3, 9))
+
+        # Asserts
+        self.assertEqual(summary["total_packages"], 0)
+        self.assertEqual(summary["distinct_tracking_codes"], 0)
+        self.assertIsNone(summary["cargo_charge_quantiles"][0.5])
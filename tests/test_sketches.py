@@ -0,0 +1,517 @@
+from unittest import TestCase
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from cargos.models import CargoShipping, CargoShippingItem, City
+from cargos.sketches import (
+    BloomFilter,
+    CargoSketch,
+    CargoSketchReport,
+    HyperLogLog,
+    QuantileSketch,
+    ScalableBloomFilter,
+    TrackingCodeIndex,
+    _registers_max,
+)
+
+
+class TestHyperLogLogFunctions(TestCase):
+    """Test case for evaluate all functions in the sketch cargos.sketches.HyperLogLog"""
+
+    def test_init_invalid_precision(self):
+        # Act & Asserts
+        with self.assertRaises(ValueError):
+            HyperLogLog(precision=3)
+
+    def test_count_empty(self):
+        # Act
+        sketch = HyperLogLog()
+
+        # Asserts
+        self.assertEqual(sketch.count(), 0)
+
+    def test_count_repeated_values(self):
+        # Arrange
+        sketch = HyperLogLog()
+
+        # Act
+        for _ in range(100):
+            sketch.add("abcd")
+
+        # Asserts
+        self.assertEqual(sketch.count(), 1)
+
+    def test_count_within_error_bound(self):
+        # Arrange
+        sketch = HyperLogLog(precision=12)
+
+        # Act
+        for code in range(20000):
+            sketch.add(f"TRK-{code}")
+
+        # Asserts
+        max_error = 3 * sketch.get_error_bound() * 20000
+        self.assertAlmostEqual(sketch.count(), 20000, delta=max_error)
+
+    def test_merge(self):
+        # Arrange
+        sketch1 = HyperLogLog(precision=10)
+        sketch2 = HyperLogLog(precision=10)
+        for code in range(500):
+            sketch1.add(f"TRK-{code}")
+            sketch2.add(f"TRK-{code + 250}")
+
+        # Act
+        sketch1.merge(sketch2)
+
+        # Asserts
+        max_error = 3 * sketch1.get_error_bound() * 750
+        self.assertAlmostEqual(sketch1.count(), 750, delta=max_error)
+
+    def test_merge_different_precision(self):
+        # Act & Asserts
+        with self.assertRaises(ValueError):
+            HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+    def test_add_densify_keeps_count(self):
+        # Arrange
+        sparse_sketch = HyperLogLog(precision=10)
+        dense_sketch = HyperLogLog(precision=10)
+        dense_sketch._densify()
+
+        # Act
+        for code in range(5000):
+            sparse_sketch.add(f"TRK-{code}")
+            dense_sketch.add(f"TRK-{code}")
+
+        # Asserts
+        self.assertIsNotNone(sparse_sketch._registers)
+        self.assertEqual(sparse_sketch._registers, dense_sketch._registers)
+        self.assertEqual(sparse_sketch.count(), dense_sketch.count())
+
+    def test_merge_sparse_and_dense(self):
+        # Arrange
+        sparse_sketch = HyperLogLog(precision=10)
+        dense_sketch = HyperLogLog(precision=10)
+        expected_sketch = HyperLogLog(precision=10)
+        for code in range(10):
+            sparse_sketch.add(f"TRK-{code}")
+            expected_sketch.add(f"TRK-{code}")
+        for code in range(5000):
+            dense_sketch.add(f"OTHER-{code}")
+            expected_sketch.add(f"OTHER-{code}")
+
+        # Act
+        sparse_sketch.merge(dense_sketch)
+
+        # Asserts
+        self.assertEqual(sparse_sketch._registers, expected_sketch._registers)
+        self.assertEqual(sparse_sketch.count(), expected_sketch.count())
+
+    def test_registers_max(self):
+        # Arrange
+        first = bytearray([0, 5, 64, 1, 63, 0, 7])
+        second = bytearray([3, 5, 1, 64, 0, 0, 8])
+
+        # Act
+        result = _registers_max(first, second)
+
+        # Asserts
+        self.assertEqual(result, bytearray([3, 5, 64, 64, 63, 0, 8]))
+
+
+class TestQuantileSketchFunctions(TestCase):
+    """Test case for evaluate all functions in the sketch cargos.sketches.QuantileSketch"""
+
+    def test_quantile_empty(self):
+        # Act
+        sketch = QuantileSketch()
+
+        # Asserts
+        self.assertIsNone(sketch.quantile(0.5))
+
+    def test_add_negative_value(self):
+        # Act & Asserts
+        with self.assertRaises(ValueError):
+            QuantileSketch().add(Decimal("-1.00"))
+
+    def test_quantile_within_error_bound(self):
+        # Arrange
+        sketch = QuantileSketch(relative_accuracy=0.01)
+
+        # Act
+        for charge in range(1, 1001):
+            sketch.add(Decimal(charge))
+
+        # Asserts
+        for q, expected in [(0, 1), (0.5, 500), (0.99, 990), (1, 1000)]:
+            max_error = Decimal(str(sketch.get_error_bound())) * expected + 1
+            self.assertAlmostEqual(sketch.quantile(q), expected, delta=max_error)
+
+    def test_quantile_small_values_within_error_bound(self):
+        # Arrange
+        sketch = QuantileSketch(relative_accuracy=0.01)
+
+        # Act
+        sketch.add(Decimal("0.001"))
+
+        # Asserts
+        self.assertAlmostEqual(
+            sketch.quantile(0.5), Decimal("0.001"), delta=Decimal("0.00001")
+        )
+
+    def test_quantile_zero_values(self):
+        # Arrange
+        sketch = QuantileSketch()
+
+        # Act
+        sketch.add(Decimal("0"))
+        sketch.add(Decimal("0"))
+        sketch.add(Decimal("10.00"))
+
+        # Asserts
+        self.assertEqual(sketch.quantile(0.5), Decimal("0"))
+
+    def test_merge(self):
+        # Arrange
+        sketch1 = QuantileSketch()
+        sketch2 = QuantileSketch()
+        sketch1.add(Decimal("10.00"))
+        sketch2.add(Decimal("20.00"))
+        sketch2.add(Decimal("20.00"))
+
+        # Act
+        sketch1.merge(sketch2)
+
+        # Asserts
+        self.assertEqual(sketch1.count, 3)
+        self.assertAlmostEqual(sketch1.quantile(0.5), Decimal("20.00"), delta=1)
+
+    def test_merge_different_accuracy(self):
+        # Act & Asserts
+        with self.assertRaises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+class TestCargoSketchFunctions(TestCase):
+    """Test case for evaluate all functions in the sketch cargos.sketches.CargoSketch"""
+
+    def test_merge_different_accuracy_keeps_sketch(self):
+        # Arrange
+        sketch1 = CargoSketch(relative_accuracy=0.01)
+        sketch2 = CargoSketch(relative_accuracy=0.02)
+        sketch2.total_packages = 1
+
+        # Act
+        with self.assertRaises(ValueError):
+            sketch1.merge(sketch2)
+
+        # Asserts
+        self.assertEqual(sketch1.total_packages, 0)
+
+
+class TestCargoSketchReportFunctions(TestCase):
+    """Test case for evaluate all functions in the sketch cargos.sketches.CargoSketchReport"""
+
+    def setUp(self) -> None:
+        # Arrange common setup
+        self.origin_city = City(1, "La Habana")
+        self.destination_city = City(2, "Buenos Aires")
+        self.other_city = City(3, "Brasilia")
+
+    def _build_shipping(self, flight_number, shipping_date, destination_city, codes):
+        return CargoShipping(
+            flight_number,
+            shipping_date,
+            self.origin_city,
+            destination_city,
+            [CargoShippingItem(code, Decimal("10.00")) for code in codes],
+        )
+
+    def test_get_summary_for_date(self):
+        # Arrange
+        report = CargoSketchReport()
+        report.add_shipping(
+            self._build_shipping(
+                "FL-1", date(2024, 3, 9), self.destination_city, ["a", "b"]
+            )
+        )
+        report.add_shipping(
+            self._build_shipping("FL-2", date(2024, 3, 9), self.other_city, ["c"])
+        )
+        report.add_shipping(
+            self._build_shipping("FL-3", date(2024, 3, 10), self.other_city, ["d"])
+        )
+
+        # Act
+        summary = report.get_summary(date(2024, 3, 9))
+
+        # Asserts
+        self.assertEqual(summary["total_packages"], 3)
+        self.assertEqual(summary["total_invoice"], Decimal("30.00"))
+        self.assertEqual(summary["distinct_tracking_codes"], 3)
+        self.assertEqual(summary["distinct_flights"], 2)
+        self.assertAlmostEqual(
+            summary["cargo_charge_quantiles"][0.5], Decimal("10.00"), delta=1
+        )
+        self.assertEqual(summary["quantile_relative_error"], 0.01)
+
+    def test_get_summary_for_range_and_route(self):
+        # Arrange
+        report = CargoSketchReport()
+        report.add_shipping(
+            self._build_shipping(
+                "FL-1", date(2024, 3, 9), self.destination_city, ["a", "b"]
+            )
+        )
+        report.add_shipping(
+            self._build_shipping("FL-2", date(2024, 3, 9), self.other_city, ["c"])
+        )
+        report.add_shipping(
+            self._build_shipping("FL-3", date(2024, 3, 10), self.other_city, ["d"])
+        )
+
+        # Act
+        summary = report.get_summary(date(2024, 3, 9), date(2024, 3, 10), route=(1, 3))
+
+        # Asserts
+        self.assertEqual(summary["total_packages"], 2)
+        self.assertEqual(summary["distinct_flights"], 2)
+
+    def test_get_summary_for_range_over_months(self):
+        # Arrange
+        report = CargoSketchReport()
+        expected_sketch = CargoSketch()
+        shipping_date = date(2024, 1, 20)
+        while shipping_date <= date(2024, 4, 10):
+            shipping = self._build_shipping(
+                f"FL-{shipping_date.day}",
+                shipping_date,
+                self.destination_city,
+                [f"{shipping_date.isoformat()}-{code}" for code in range(3)],
+            )
+            report.add_shipping(shipping)
+            if date(2024, 1, 25) <= shipping_date <= date(2024, 4, 5):
+                expected_sketch.add_shipping(shipping)
+            shipping_date += timedelta(days=1)
+
+        # Act
+        summary = report.get_summary(date(2024, 1, 25), date(2024, 4, 5))
+        route_summary = report.get_summary(
+            date(2024, 1, 25), date(2024, 4, 5), route=(1, 2)
+        )
+
+        # Asserts
+        self.assertEqual(summary["total_packages"], expected_sketch.total_packages)
+        self.assertEqual(summary["total_invoice"], expected_sketch.total_invoice)
+        self.assertEqual(
+            summary["distinct_tracking_codes"], expected_sketch.tracking_codes.count()
+        )
+        self.assertEqual(
+            summary["distinct_flights"], expected_sketch.flight_numbers.count()
+        )
+        self.assertEqual(summary, route_summary)
+
+    def test_merge_different_precision_keeps_report(self):
+        # Arrange
+        report1 = CargoSketchReport(precision=12)
+        report2 = CargoSketchReport(precision=10)
+        report1.add_shipping(
+            self._build_shipping("FL-1", date(2024, 3, 9), self.destination_city, ["a"])
+        )
+        report2.add_shipping(
+            self._build_shipping("FL-2", date(2024, 3, 9), self.destination_city, ["b"])
+        )
+
+        # Act
+        with self.assertRaises(ValueError):
+            report1.merge(report2)
+
+        # Asserts
+        summary = report1.get_summary(date(2024, 3, 9))
+        self.assertEqual(summary["total_packages"], 1)
+        self.assertEqual(summary["total_invoice"], Decimal("10.00"))
+
+    def test_merge(self):
+        # Arrange
+        report1 = CargoSketchReport()
+        report2 = CargoSketchReport()
+        report1.add_shipping(
+            self._build_shipping(
+                "FL-1", date(2024, 3, 9), self.destination_city, ["a", "b"]
+            )
+        )
+        report2.add_shipping(
+            self._build_shipping(
+                "FL-2", date(2024, 3, 9), self.destination_city, ["b", "c"]
+            )
+        )
+
+        # Act
+        report1.merge(report2)
+        summary = report1.get_summary(date(2024, 3, 9))
+
+        # Asserts
+        self.assertEqual(summary["total_packages"], 4)
+        self.assertEqual(summary["total_invoice"], Decimal("40.00"))
+        self.assertEqual(summary["distinct_tracking_codes"], 3)
+
+
+class TestBloomFilterFunctions(TestCase):
+    """Test case for evaluate all functions in the sketch cargos.sketches.BloomFilter"""
+
+    def test_init_invalid_values(self):
+        # Act & Asserts
+        with self.assertRaises(ValueError):
+            BloomFilter(capacity=0)
+        with self.assertRaises(ValueError):
+            BloomFilter(capacity=10, error_rate=1)
+
+    def test_contains_added_values(self):
+        # Arrange
+        bloom_filter = BloomFilter(capacity=1000)
+
+        # Act
+        for code in range(1000):
+            bloom_filter.add(f"TRK-{code}")
+
+        # Asserts
+        for code in range(1000):
+            self.assertIn(f"TRK-{code}", bloom_filter)
+
+    def test_add_returns_if_probably_added(self):
+        # Arrange
+        bloom_filter = BloomFilter(capacity=1000)
+
+        # Act
+        results = [bloom_filter.add("abcd"), bloom_filter.add("abcd")]
+
+        # Asserts
+        self.assertEqual(results, [False, True])
+
+    def test_false_positive_rate(self):
+        # Arrange
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        for code in range(1000):
+            bloom_filter.add(f"TRK-{code}")
+
+        # Act
+        false_positives = sum(f"OTHER-{code}" in bloom_filter for code in range(10000))
+
+        # Asserts
+        self.assertLess(false_positives, 300)
+
+
+class TestScalableBloomFilterFunctions(TestCase):
+    """Test case for evaluate all functions in the sketch cargos.sketches.ScalableBloomFilter"""
+
+    def test_init_invalid_values(self):
+        # Act & Asserts
+        with self.assertRaises(ValueError):
+            ScalableBloomFilter(capacity=0)
+        with self.assertRaises(ValueError):
+            ScalableBloomFilter(capacity=10, error_rate=1)
+
+    def test_add_over_capacity_contains_added_values(self):
+        # Arrange
+        bloom_filter = ScalableBloomFilter(capacity=10)
+
+        # Act
+        results = [bloom_filter.add(f"TRK-{code}") for code in range(5000)]
+
+        # Asserts
+        self.assertLess(sum(results), 100)
+        self.assertGreater(len(bloom_filter._bloom_filters), 1)
+        self.assertTrue(all(f"TRK-{code}" in bloom_filter for code in range(5000)))
+        self.assertTrue(bloom_filter.add("TRK-0"))
+
+    def test_false_positive_rate_over_capacity(self):
+        # Arrange
+        bloom_filter = ScalableBloomFilter(capacity=512, error_rate=0.01)
+        for code in range(10000):
+            bloom_filter.add(f"TRK-{code}")
+
+        # Act
+        false_positives = sum(f"OTHER-{code}" in bloom_filter for code in range(10000))
+
+        # Asserts
+        self.assertLess(false_positives, 300)
+
+
+class NotIterableStore(set):
+    """Exact store that fails if it's iterated"""
+
+    def __iter__(self):
+        raise AssertionError("exact store must not be iterated")
+
+
+class TestTrackingCodeIndexFunctions(TestCase):
+    """Test case for evaluate all functions in the sketch cargos.sketches.TrackingCodeIndex"""
+
+    def test_add_new_tracking_codes(self):
+        # Arrange
+        index = TrackingCodeIndex(capacity=10)
+
+        # Act
+        results = [index.add("abcd"), index.add("efgh")]
+
+        # Asserts
+        self.assertEqual(results, [True, True])
+        self.assertEqual(len(index), 2)
+        self.assertIn("abcd", index)
+        self.assertNotIn("ijkl", index)
+        self.assertEqual(index.get_duplicates_count(), 0)
+
+    def test_add_duplicated_tracking_code(self):
+        # Arrange
+        index = TrackingCodeIndex(capacity=10)
+        index.add("abcd")
+
+        # Act
+        result = index.add("abcd")
+
+        # Asserts
+        self.assertFalse(result)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.get_duplicates_count(), 1)
+
+    def test_add_over_capacity_is_exact(self):
+        # Arrange
+        index = TrackingCodeIndex(capacity=10)
+
+        # Act
+        results = [index.add(f"TRK-{code}") for code in range(1000)]
+
+        # Asserts
+        self.assertTrue(all(results))
+        self.assertEqual(index.get_duplicates_count(), 0)
+        self.assertIn("TRK-0", index)
+        self.assertFalse(index.add("TRK-999"))
+
+    def test_add_over_capacity_never_iterates_exact_store(self):
+        # Arrange
+        index = TrackingCodeIndex(capacity=10, exact_store=NotIterableStore())
+
+        # Act
+        results = [index.add(f"TRK-{code}") for code in range(1000)]
+
+        # Asserts
+        self.assertTrue(all(results))
+        self.assertEqual(len(index), 1000)
+
+    def test_add_checks_exact_store_only_for_probable_duplicates(self):
+        # Arrange
+        exact_store = set()
+        index = TrackingCodeIndex(capacity=1000, exact_store=exact_store)
+
+        # Act
+        for code in range(1000):
+            index.add(f"TRK-{code}")
+        index.add("TRK-0")
+
+        # Asserts
+        self.assertEqual(len(exact_store), 1000)
+        self.assertEqual(index.get_duplicates_count(), 1)
+        self.assertGreaterEqual(index.get_exact_lookups_count(), 1)
+        self.assertLess(index.get_exact_lookups_count(), 50)